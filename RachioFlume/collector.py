@@ -23,12 +23,14 @@ class WaterTrackingCollector:
         alert_engine: Optional[AlertEngine] = None,
         hose_processors: Optional[List[HoseTimerProcessor]] = None,
         stale_zone_checker: Optional[StaleZoneChecker] = None,
+        rachio_client: Optional[RachioClient] = None,
+        flume_client: Optional[FlumeClient] = None,
     ):
         self.logger = get_logger(__name__)
 
         self.db = WaterTrackingDB(db_path)
-        self.rachio_client = RachioClient()
-        self.flume_client = FlumeClient()
+        self.rachio_client = rachio_client or RachioClient()
+        self.flume_client = flume_client or FlumeClient()
         self.poll_interval = poll_interval_seconds
         self.alert_engine = alert_engine
         self.hose_processors = hose_processors or []
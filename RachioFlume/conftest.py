@@ -0,0 +1,42 @@
+"""Shared fixtures for RachioFlume tests."""
+
+import shutil
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+from uuid import uuid4
+
+import pytest
+
+from RachioFlume.data_storage import WaterTrackingDB
+
+
+@pytest.fixture(scope="session")
+def template_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Schema-initialized database built once per session (per xdist worker)."""
+    path = tmp_path_factory.mktemp("template") / "water.db"
+    WaterTrackingDB(str(path))
+    return path
+
+
+@pytest.fixture
+def db_path(tmp_path: Path, template_db: Path) -> str:
+    """Path to a private copy of the template DB, so tests skip schema setup."""
+    dst = tmp_path / "water.db"
+    shutil.copyfile(template_db, dst)
+    return str(dst)
+
+
+@pytest.fixture
+def memory_db() -> Iterator[WaterTrackingDB]:
+    """WaterTrackingDB on a private shared-cache in-memory database.
+
+    The anchor connection keeps the database alive between the short-lived
+    connections WaterTrackingDB opens per call.
+    """
+    uri = f"file:water-{uuid4().hex}?mode=memory&cache=shared"
+    anchor = sqlite3.connect(uri, uri=True)
+    try:
+        yield WaterTrackingDB(uri, uri=True)
+    finally:
+        anchor.close()
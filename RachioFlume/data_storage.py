@@ -1,11 +1,13 @@
 """Data storage for water tracking integration."""
 
+import json
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Generator
+from typing import List, Dict, Any, Optional, Generator, Tuple, Union
 from contextlib import contextmanager
 
+from RachioFlume.alert_rules import compact_zone_label
 from RachioFlume.rachio_client import WateringEvent, Zone
 from RachioFlume.flume_client import WaterReading
 from lib.logger import get_logger
@@ -14,8 +16,17 @@ from lib.logger import get_logger
 class WaterTrackingDB:
     """SQLite database for storing water tracking data."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, uri: bool = False):
+        """Open (and if needed create) the database at `db_path`.
+
+        With `uri=True`, `db_path` is an SQLite URI filename passed to
+        sqlite3 verbatim, e.g. ``file:name?mode=memory&cache=shared`` for an
+        in-memory DB shared by every connection this class opens. Such a DB
+        lives only while some connection to it stays open.
+        """
         self.db_path = Path(db_path)
+        self._connect_target: Union[str, Path] = db_path if uri else self.db_path
+        self._uri = uri
         self.logger = get_logger(__name__)
         self.logger.info(f"Initializing water tracking database at {self.db_path}")
         self.init_database()
@@ -248,7 +259,7 @@ class WaterTrackingDB:
     @contextmanager
     def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
         """Get database connection with automatic cleanup."""
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self._connect_target, uri=self._uri)
         conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
         try:
             yield conn
@@ -279,6 +290,20 @@ class WaterTrackingDB:
             conn.commit()
             self.logger.debug(f"Successfully saved {len(zones)} zones")
 
+    def get_zones(self) -> List[Dict[str, Any]]:
+        """Get all stored zones, ordered by zone number."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM zones ORDER BY zone_number")
+            return [dict(row) for row in cursor.fetchall()]
+
+    def list_tables(self) -> List[str]:
+        """Get the names of all tables in the database."""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name")
+            return [row["name"] for row in cursor.fetchall()]
+
     def save_watering_events(self, events: List[WateringEvent]) -> None:
         """Save watering events to database."""
         if not events:
@@ -429,28 +454,40 @@ class WaterTrackingDB:
             return result["total"] or 0.0
 
     def get_period_zone_stats(
-        self, start_date: datetime, end_date: datetime
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        flow_thresholds: Optional[Dict[str, float]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get period statistics by zone for a custom date range."""
+        """Get period statistics by zone for a custom date range.
+
+        Numeric aggregates are COALESCEd to 0 so callers never see NULL.
+        ``flow_thresholds`` maps ``str(zone_number)`` to a GPM ceiling; each
+        row's ``alert_sessions`` counts sessions whose average flow exceeded
+        it, computed in the same scan as the aggregates.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
                 """
                 SELECT 
-                    zone_name,
-                    zone_number,
+                    zs.zone_name,
+                    zs.zone_number,
                     COUNT(*) as session_count,
-                    SUM(duration_seconds) as total_duration_seconds,
-                    AVG(duration_seconds) as avg_duration_seconds,
-                    SUM(total_water_used) as total_water_used,
-                    AVG(average_flow_rate) as avg_flow_rate
-                FROM zone_sessions
-                WHERE start_time >= ? AND start_time < ?
-                GROUP BY zone_name, zone_number
-                ORDER BY zone_number
+                    COALESCE(SUM(zs.duration_seconds), 0) as total_duration_seconds,
+                    COALESCE(AVG(zs.duration_seconds), 0) as avg_duration_seconds,
+                    COALESCE(SUM(zs.total_water_used), 0.0) as total_water_used,
+                    COALESCE(AVG(zs.average_flow_rate), 0.0) as avg_flow_rate,
+                    SUM(CASE WHEN zs.average_flow_rate > t.value THEN 1 ELSE 0 END)
+                        as alert_sessions
+                FROM zone_sessions zs
+                LEFT JOIN json_each(?) t ON t.key = CAST(zs.zone_number AS TEXT)
+                WHERE zs.start_time >= ? AND zs.start_time < ?
+                GROUP BY zs.zone_name, zs.zone_number
+                ORDER BY zs.zone_number, zs.zone_name
             """,
-                (start_date, end_date),
+                (json.dumps(flow_thresholds or {}), start_date, end_date),
             )
 
             return [dict(row) for row in cursor.fetchall()]
@@ -646,6 +683,60 @@ class WaterTrackingDB:
             )
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_hose_period_stats(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        flow_thresholds: Optional[Dict[Tuple[str, str], float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get per-valve hose-timer session totals for a date range.
+
+        Grouped in SQLite so the report doesn't materialize every session row.
+        ``avg_flow_rate`` is volume over run time for the whole period, not a
+        mean of per-session rates. ``flow_thresholds`` maps
+        ``(base_station_label, valve_name)`` to a GPM ceiling; ``alert_sessions``
+        counts sessions whose own volume / run time exceeded it.
+        Valves come back ordered by their compact report label, then by first
+        run in the range, so report rows need no re-sort.
+        """
+        thresholds_json = json.dumps(
+            [[label, valve, gpm] for (label, valve), gpm in (flow_thresholds or {}).items()]
+        )
+        with self.get_connection() as conn:
+            conn.create_function("compact_zone_label", 1, compact_zone_label, deterministic=True)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT
+                    hs.base_station_label,
+                    hs.valve_name,
+                    COUNT(*) AS session_count,
+                    COALESCE(SUM(hs.duration_seconds), 0) AS total_duration_seconds,
+                    COALESCE(SUM(hs.duration_seconds), 0) * 1.0 / COUNT(*) AS avg_duration_seconds,
+                    COALESCE(SUM(hs.total_water_used), 0.0) AS total_water_used,
+                    CASE WHEN SUM(hs.duration_seconds) > 0
+                        THEN COALESCE(SUM(hs.total_water_used), 0.0)
+                            / (SUM(hs.duration_seconds) / 60.0)
+                        ELSE 0.0
+                    END AS avg_flow_rate,
+                    SUM(
+                        CASE WHEN hs.duration_seconds > 0
+                            AND COALESCE(hs.total_water_used, 0.0)
+                                / (hs.duration_seconds / 60.0) > json_extract(t.value, '$[2]')
+                        THEN 1 ELSE 0 END
+                    ) AS alert_sessions
+                FROM hose_zone_sessions hs
+                LEFT JOIN json_each(?) t
+                    ON json_extract(t.value, '$[0]') = hs.base_station_label
+                    AND json_extract(t.value, '$[1]') = hs.valve_name
+                WHERE hs.start_time >= ? AND hs.start_time <= ?
+                GROUP BY hs.base_station_label, hs.valve_name
+                ORDER BY compact_zone_label(hs.valve_name), MIN(hs.start_time)
+                """,
+                (thresholds_json, start_date, end_date),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
     def get_last_data_timestamp(self, source: str) -> Optional[datetime]:
         """Get the actual last timestamp from data tables."""
         with self.get_connection() as conn:
@@ -40,6 +40,7 @@ class RachioClient:
         api_key: Optional[str] = None,
         device_id: Optional[str] = None,
         label: Optional[str] = None,
+        session: Optional[requests.Session] = None,
     ):
         """Initialize Rachio Smart Sprinkler Controller client.
 
@@ -47,6 +48,7 @@ class RachioClient:
             api_key: Rachio API key (defaults to cfg.rachio.api_key)
             device_id: Rachio device ID (defaults to first controller in cfg.rachio.devices)
             label: Human-readable device label (defaults to matching controller's label)
+            session: HTTP session (defaults to a new requests.Session)
         """
         cfg = get_config()
         self.api_key = api_key or cfg.rachio.api_key
@@ -68,6 +70,9 @@ class RachioClient:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        # Injectable for tests (no patch()); keeps the API connection alive
+        # across the collector's polls.
+        self.session = session or requests.Session()
 
         # Setup logging
         self.logger = get_logger(__name__)
@@ -76,7 +81,7 @@ class RachioClient:
     def get_device_info(self) -> Dict[str, Any]:
         """Get device information including zones."""
         url = f"{self.BASE_URL}/device/{self.device_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.session.get(url, headers=self.headers)
         response.raise_for_status()
         device_info: Dict[str, Any] = response.json()
         self.logger.info(f"Retrieved device info for {device_info.get('name', 'Unknown Device')}")
@@ -103,7 +108,7 @@ class RachioClient:
         try:
             # Check current schedule execution status
             url = f"{self.BASE_URL}/device/{self.device_id}/current_schedule"
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers)
 
             if response.status_code == 200:
                 current_schedule = response.json()
@@ -157,7 +162,7 @@ class RachioClient:
             "topic": "WATERING",
         }
 
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.session.get(url, headers=self.headers, params=params)
         response.raise_for_status()
 
         events = []
@@ -1,9 +1,11 @@
 """Weekly reporting system for water tracking data."""
 
+import io
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 
 from RachioFlume.alert_rules import compact_zone_label, load_zone_thresholds_from_config
@@ -31,6 +33,31 @@ class ZoneStats:
 # Hose valves have no controller zone number; sort them after real zones.
 HOSE_ZONE_SENTINEL = 999
 
+# Fixed-width row layouts, bound once at import. Zone rows line up under the
+# header built in format_report_text (the `.8` precision truncates the name,
+# and the row carries its own newline); raw rows under print_raw_report's header.
+_ZONE_ROW_FMT = "{:<8.8} {:>6.1f} {:>5d} {:>5.1f} {:>5} {:>4}\n".format
+_RAW_ROW_FMT = "{:25} | {:7.2f} | {:7.2f} | {:7.2f} | {:6} | {:7.2f}".format
+
+
+def _round_zone_columns(
+    zone_stats: List[Dict[str, Any]], flow_digits: int = 2
+) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """Round the per-zone numeric columns of `get_period_zone_stats` rows.
+
+    Also used for `get_hose_period_stats` rows, which carry the same columns;
+    hose reports have always shown flow to one decimal (`flow_digits=1`).
+
+    Returns (total_minutes, average_minutes, water_gallons, flow_gpm), each
+    aligned with `zone_stats`. The query COALESCEs NULL aggregates to 0.
+    """
+    return (
+        [round(s["total_duration_seconds"] / 60.0, 1) for s in zone_stats],
+        [round(s["avg_duration_seconds"] / 60.0, 1) for s in zone_stats],
+        [round(s["total_water_used"], 1) for s in zone_stats],
+        [round(s["avg_flow_rate"], flow_digits) for s in zone_stats],
+    )
+
 
 @dataclass
 class ReportSummary:
@@ -63,6 +90,8 @@ class WeeklyReporter:
     def __init__(self, db_path: str):
         self.db = WaterTrackingDB(db_path)
         self.logger = get_logger(__name__)
+        # Report output directories already created by save_report_to_file.
+        self._ensured_dirs: Set[Path] = set()
         self.logger.info("Weekly reporter initialized")
 
     def generate_period_report_with_dates(
@@ -104,95 +133,30 @@ class WeeklyReporter:
                 if zone_key.isdigit():
                     ctrl_thresh[zone_key] = zone_zt
 
-        # Per-session alert counts by zone_number and by (label, valve_name).
-        ctrl_alerts: Dict[int, int] = {}
-        for s in self.db.get_zone_sessions(period_start, period_end):
-            sess_zt = ctrl_thresh.get(str(s["zone_number"]))
-            if sess_zt and (s.get("avg_flow_rate") or 0) > sess_zt.compute_threshold(
-                abs_gpm, pct_above
-            ):
-                ctrl_alerts[s["zone_number"]] = ctrl_alerts.get(s["zone_number"], 0) + 1
-
-        # Get zone aggregate statistics for the period
-        zone_stats = self.db.get_period_zone_stats(period_start, period_end)
-
-        # Format zone statistics for display
-        formatted_zones = []
-        for stat in zone_stats:
-            duration_minutes = (stat["total_duration_seconds"] or 0) / 60.0
-            avg_duration_minutes = (stat["avg_duration_seconds"] or 0) / 60.0
-            stat_zt = ctrl_thresh.get(str(stat["zone_number"]))
-            threshold_gpm = (
-                round(stat_zt.compute_threshold(abs_gpm, pct_above), 2) if stat_zt else 0.0
-            )
-
-            zone_stats_obj = ZoneStats(
-                zone_number=stat["zone_number"],
-                zone_name=stat["zone_name"],
-                sessions=stat["session_count"],
-                total_duration_minutes=round(duration_minutes, 1),
-                average_duration_minutes=round(avg_duration_minutes, 1),
-                total_water_gallons=round(stat["total_water_used"] or 0, 1),
-                average_flow_rate_gpm=round(stat["avg_flow_rate"] or 0, 2),
-                threshold_gpm=threshold_gpm,
-                alert_sessions=ctrl_alerts.get(stat["zone_number"], 0),
-            )
-            formatted_zones.append(zone_stats_obj)
-
-        # Aggregate hose-timer sessions and append as rows in the same table.
-        # Hose valves are treated identically to controller zones: they count
-        # toward zones_watered, contribute to total sessions / total duration,
-        # and share the same column layout. Volume + rate come from the Flume
-        # window aggregate captured by hose_timer_processor at run end.
-        hose_sessions = self.db.get_hose_zone_sessions(period_start, period_end)
-        hose_agg: Dict[tuple, Dict[str, Any]] = {}
-        hose_alerts: Dict[tuple, int] = {}
-        for s in hose_sessions:
-            key = (s["base_station_label"], s["valve_name"])
-            slot = hose_agg.setdefault(
-                key, {"sessions": 0, "duration_sec_total": 0, "gal_total": 0.0}
-            )
-            slot["sessions"] += 1
-            duration_sec = s.get("duration_seconds") or 0
-            slot["duration_sec_total"] += duration_sec
-            gal = float(s.get("total_water_used") or 0.0)
-            slot["gal_total"] += gal
-            hose_zt = all_thresholds.get(s["base_station_label"], {}).get(s["valve_name"])
-            if hose_zt and duration_sec > 0:
-                sess_avg = gal / (duration_sec / 60.0)
-                if sess_avg > hose_zt.compute_threshold(abs_gpm, pct_above):
-                    hose_alerts[key] = hose_alerts.get(key, 0) + 1
-
-        for (label, name), v in hose_agg.items():
-            zt = all_thresholds.get(label, {}).get(name)
-            threshold_gpm = round(zt.compute_threshold(abs_gpm, pct_above), 2) if zt else 0.0
-            dur_min = v["duration_sec_total"] / 60.0
-            avg_gpm = v["gal_total"] / dur_min if dur_min > 0 else 0.0
-            formatted_zones.append(
-                ZoneStats(
-                    zone_number=HOSE_ZONE_SENTINEL,
-                    zone_name=compact_zone_label(name),
-                    sessions=v["sessions"],
-                    total_duration_minutes=round(dur_min, 1),
-                    average_duration_minutes=round(
-                        (v["duration_sec_total"] / max(v["sessions"], 1)) / 60.0, 1
-                    ),
-                    total_water_gallons=round(v["gal_total"], 1),
-                    average_flow_rate_gpm=round(avg_gpm, 1),
-                    threshold_gpm=threshold_gpm,
-                    alert_sessions=hose_alerts.get((label, name), 0),
-                )
-            )
+        formatted_zones = self._controller_zone_rows(
+            period_start, period_end, ctrl_thresh, abs_gpm, pct_above
+        )
+        # Hose-timer valves are appended as rows in the same table.
+        formatted_zones.extend(
+            self._hose_zone_rows(period_start, period_end, all_thresholds, abs_gpm, pct_above)
+        )
 
-        # Sort: controller zones by number, hose valves alphabetical after them
-        formatted_zones.sort(key=lambda x: (x.zone_number, x.zone_name))
+        # Both queries return rows already ordered (controller zones by number,
+        # hose valves by name under the 999 sentinel), so no re-sort is needed.
+        # Summary totals are folded in one pass over the merged list so
+        # zones_watered / totals include hose valves.
+        total_sessions = 0
+        total_minutes = 0.0
+        total_gallons = 0.0
+        for z in formatted_zones:
+            total_sessions += z.sessions
+            total_minutes += z.total_duration_minutes
+            total_gallons += z.total_water_gallons
 
-        # Summary aggregates over the merged list so zones_watered / totals
-        # include hose valves.
         summary = ReportSummary(
-            total_watering_sessions=sum(z.sessions for z in formatted_zones),
-            total_duration_minutes=round(sum(z.total_duration_minutes for z in formatted_zones), 1),
-            total_water_used_gallons=round(sum(z.total_water_gallons for z in formatted_zones), 1),
+            total_watering_sessions=total_sessions,
+            total_duration_minutes=round(total_minutes, 1),
+            total_water_used_gallons=round(total_gallons, 1),
             zones_watered=len(formatted_zones),
         )
 
@@ -204,6 +168,114 @@ class WeeklyReporter:
             zones=formatted_zones,
         )
 
+    def generate_period_reports(
+        self, periods: List[Tuple[datetime, datetime]]
+    ) -> Iterator[WaterUsageReport]:
+        """Yield one report per (start, end) period, in the given order.
+
+        The next period's report is built on a worker thread while the
+        caller formats / sends the current one. Each query opens its own
+        SQLite connection, so the overlap is safe.
+        """
+        if not periods:
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self.generate_period_report_with_dates, *periods[0])
+            for next_period in periods[1:]:
+                report = pending.result()
+                pending = executor.submit(self.generate_period_report_with_dates, *next_period)
+                yield report
+            yield pending.result()
+
+    def _controller_zone_rows(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        ctrl_thresh: Dict[str, Any],
+        abs_gpm: float,
+        pct_above: float,
+    ) -> List[ZoneStats]:
+        """One ZoneStats row per controller zone watered in the period."""
+        # Alert counts ride along in the aggregate query, so one scan of
+        # zone_sessions serves both the totals and the threshold check.
+        flow_thresholds = {
+            zone_key: zt.compute_threshold(abs_gpm, pct_above)
+            for zone_key, zt in ctrl_thresh.items()
+        }
+        zone_stats = self.db.get_period_zone_stats(period_start, period_end, flow_thresholds)
+
+        # Format zone statistics for display
+        rows = []
+        for stat, total_min, avg_min, water_gal, flow_gpm in zip(
+            zone_stats, *_round_zone_columns(zone_stats)
+        ):
+            zone_threshold = flow_thresholds.get(str(stat["zone_number"]))
+            threshold_gpm = round(zone_threshold, 2) if zone_threshold is not None else 0.0
+
+            rows.append(
+                ZoneStats(
+                    zone_number=stat["zone_number"],
+                    zone_name=stat["zone_name"],
+                    sessions=stat["session_count"],
+                    total_duration_minutes=total_min,
+                    average_duration_minutes=avg_min,
+                    total_water_gallons=water_gal,
+                    average_flow_rate_gpm=flow_gpm,
+                    threshold_gpm=threshold_gpm,
+                    alert_sessions=stat["alert_sessions"],
+                )
+            )
+        return rows
+
+    def _hose_zone_rows(
+        self,
+        period_start: datetime,
+        period_end: datetime,
+        all_thresholds: Dict[str, Dict[str, Any]],
+        abs_gpm: float,
+        pct_above: float,
+    ) -> List[ZoneStats]:
+        """One ZoneStats row per hose-timer valve watered in the period.
+
+        Hose valves are treated identically to controller zones: they count
+        toward zones_watered, contribute to total sessions / total duration,
+        and share the same column layout. Volume + rate come from the Flume
+        window aggregate captured by hose_timer_processor at run end.
+        """
+        # Thresholds go into the aggregate query, which also counts per-session
+        # alerts, so no per-session rows are pulled into Python.
+        hose_thresholds = {
+            (label, zone_key): zt.compute_threshold(abs_gpm, pct_above)
+            for label, zones in all_thresholds.items()
+            for zone_key, zt in zones.items()
+        }
+
+        # Totals, per-session average and flow rate per valve are all
+        # computed by SQLite (GROUP BY), with the same column names as
+        # get_period_zone_stats, so display rounding shares that path.
+        hose_stats = self.db.get_hose_period_stats(period_start, period_end, hose_thresholds)
+        rows = []
+        for stat, total_min, avg_min, water_gal, flow_gpm in zip(
+            hose_stats, *_round_zone_columns(hose_stats, flow_digits=1)
+        ):
+            label, name = stat["base_station_label"], stat["valve_name"]
+            zone_threshold = hose_thresholds.get((label, name))
+            threshold_gpm = round(zone_threshold, 2) if zone_threshold is not None else 0.0
+            rows.append(
+                ZoneStats(
+                    zone_number=HOSE_ZONE_SENTINEL,
+                    zone_name=compact_zone_label(name),
+                    sessions=stat["session_count"],
+                    total_duration_minutes=total_min,
+                    average_duration_minutes=avg_min,
+                    total_water_gallons=water_gal,
+                    average_flow_rate_gpm=flow_gpm,
+                    threshold_gpm=threshold_gpm,
+                    alert_sessions=stat["alert_sessions"],
+                )
+            )
+        return rows
+
     def save_report_to_file(self, report: WaterUsageReport, filename: str) -> None:
         """Save report to JSON file.
 
@@ -212,7 +284,10 @@ class WeeklyReporter:
             filename: Output filename
         """
         output_path = Path(filename)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        parent = output_path.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
 
         with open(output_path, "w") as f:
             json.dump(report.to_dict(), f, indent=2, default=str)
@@ -225,50 +300,56 @@ class WeeklyReporter:
         `<html>` prefix and sends HTML. Kept as a separate step so
         `print_report` and tests can inspect the raw text.
         """
-        lines: List[str] = []
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append("WATER USAGE REPORT")
-        lines.append(f"Period: {report.period_start.date()} to {report.period_end.date()}")
-        lines.append("=" * 40)
+        write("WATER USAGE REPORT\n")
+        write(f"Period: {report.period_start.date()} to {report.period_end.date()}\n")
+        write("=" * 40 + "\n")
 
-        lines.append("")
-        lines.append("SUMMARY:")
-        lines.append(f"  Total duration: {report.summary.total_duration_minutes} min")
-        lines.append(
-            f"  Total water used: {int(round(report.summary.total_water_used_gallons))} gallons"
+        write("\nSUMMARY:\n")
+        write(f"  Total duration: {report.summary.total_duration_minutes} min\n")
+        write(
+            f"  Total water used: {int(round(report.summary.total_water_used_gallons))} gallons\n"
         )
-        lines.append(f"  Zones watered: {report.summary.zones_watered}")
+        write(f"  Zones watered: {report.summary.zones_watered}\n")
 
         if report.zones:
-            lines.append("")
-            lines.append("ZONE DETAILS:")
+            write("\nZONE DETAILS:\n")
             # Numeric columns are right-aligned so decimals and thousands align
             # visually down the column. Name stays left-aligned.
             # Thr = anomaly threshold GPM (blank if zone not configured).
             # Alrt = # sessions in period where session avg flow > threshold.
             header = f"{'Name':<8} {'Min':>6} {'Gals':>5} {'GPM':>5} {'Thr':>5} {'Alrt':>4}"
-            lines.append(header)
-            lines.append("-" * len(header))
+            write(header + "\n")
+            write("-" * len(header) + "\n")
 
             for zone in report.zones:
                 thr = f"{zone.threshold_gpm:.1f}" if zone.threshold_gpm > 0 else "-"
                 alrt = str(zone.alert_sessions) if zone.alert_sessions else "-"
-                lines.append(
-                    f"{zone.zone_name[:8]:<8} "
-                    f"{zone.total_duration_minutes:>6.1f} "
-                    f"{int(round(zone.total_water_gallons)):>5d} "
-                    f"{zone.average_flow_rate_gpm:>5.1f} "
-                    f"{thr:>5} "
-                    f"{alrt:>4}"
+                write(
+                    _ZONE_ROW_FMT(
+                        zone.zone_name,
+                        zone.total_duration_minutes,
+                        int(round(zone.total_water_gallons)),
+                        zone.average_flow_rate_gpm,
+                        thr,
+                        alrt,
+                    )
                 )
 
-        lines.append("")
-        lines.append("=" * 40)
-        return "\n".join(lines)
+        write("\n" + "=" * 40)
+        return buf.getvalue()
+
+    def format_report_html(
+        self, report: WaterUsageReport, report_text: Optional[str] = None
+    ) -> str:
+        """HTML wrapper so iOS Mail / Gmail render fixed-width without wrap.
 
-    def format_report_html(self, report: WaterUsageReport) -> str:
-        """HTML wrapper so iOS Mail / Gmail render fixed-width without wrap."""
-        body = self.format_report_text(report)
+        Pass `report_text` when the caller already formatted the report, to
+        skip a second `format_report_text` pass.
+        """
+        body = report_text if report_text is not None else self.format_report_text(report)
         return (
             "<html><body>"
             "<pre style=\"font-family: 'SF Mono', Menlo, Consolas, monospace; "
@@ -277,32 +358,35 @@ class WeeklyReporter:
             "</pre></body></html>"
         )
 
-    def print_report(self, report: WaterUsageReport) -> None:
+    def print_report(self, report: WaterUsageReport, report_text: Optional[str] = None) -> None:
         """Print report in a readable format."""
-        report_text = self.format_report_text(report)
+        if report_text is None:
+            report_text = self.format_report_text(report)
 
-        # Log each line separately for proper logger formatting
-        for line in report_text.split("\n"):
-            self.logger.info(line)
+        # One record for the whole table; the leading newline keeps the
+        # fixed-width columns clear of the log prefix.
+        self.logger.info("\n%s", report_text)
 
     def print_raw_report(self, report: Dict[str, Any]) -> None:
         """Print raw data report in a readable format."""
-        self.logger.info("=" * 35)
-        self.logger.info("RAW WATER USAGE DATA REPORT")
-        self.logger.info("=" * 35)
-        self.logger.info(f"Report Generated: {report['report_generated']}")
-        self.logger.info(f"Time Period: {report['period_start']} to {report['period_end']}")
-        self.logger.info(f"Interval: {report['interval_minutes']} minutes")
-        self.logger.info(f"Total Data Points: {len(report['data_points'])}")
-        self.logger.info("")
+        lines = [
+            "=" * 35,
+            "RAW WATER USAGE DATA REPORT",
+            "=" * 35,
+            f"Report Generated: {report['report_generated']}",
+            f"Time Period: {report['period_start']} to {report['period_end']}",
+            f"Interval: {report['interval_minutes']} minutes",
+            f"Total Data Points: {len(report['data_points'])}",
+            "",
+        ]
 
         if not report["data_points"]:
-            self.logger.info("No data available for this time period.")
+            lines.append("No data available for this time period.")
         else:
-            self.logger.info(
+            lines.append(
                 "Time Interval               | Avg GPM | Max GPM | Min GPM | Points | Active Avg"
             )
-            self.logger.info("-" * 35)
+            lines.append("-" * 35)
 
             for data_point in report["data_points"]:
                 time_str = data_point["interval_start"]
@@ -312,22 +396,26 @@ class WeeklyReporter:
                 points = data_point["data_points"]
                 active_avg = data_point["avg_active_flow_rate"] or 0
 
-                self.logger.info(
-                    f"{time_str[:16]:25} | {avg_flow:7.2f} | {max_flow:7.2f} | {min_flow:7.2f} | {points:6} | {active_avg:7.2f}"
+                lines.append(
+                    _RAW_ROW_FMT(time_str[:16], avg_flow, max_flow, min_flow, points, active_avg)
                 )
 
-        self.logger.info("=" * 35)
+        lines.append("=" * 35)
+        self.logger.info("\n%s", "\n".join(lines))
 
-    def email_report(self, report: WaterUsageReport, alert: bool = False) -> None:
+    def email_report(
+        self, report: WaterUsageReport, alert: bool = False, report_text: Optional[str] = None
+    ) -> None:
         """Email report in formatted text.
 
         Args:
             report: Report data
             alert: Whether to mark as alert email
+            report_text: Pre-formatted `format_report_text` output, if already built
         """
         # HTML wrapper — Mailer auto-detects the `<html>` prefix and sends
         # multipart/HTML. Renders fixed-width in iOS Mail / Gmail without wrap.
-        report_html = self.format_report_html(report)
+        report_html = self.format_report_html(report, report_text)
 
         start_date = report.period_start.date()
         subject_prefix = "Period"
@@ -4,14 +4,15 @@
 import asyncio
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from time import sleep
+from typing import Callable, Dict
 from RachioFlume.alert_engine import AlertEngine
 from RachioFlume.alert_rules import (
     get_controller_zone_thresholds,
     load_rules_from_config,
     load_zone_thresholds_from_config,
 )
-from RachioFlume.collector import WaterTrackingCollector
 from RachioFlume.data_storage import WaterTrackingDB
 from RachioFlume.flume_client import FlumeClient
 from RachioFlume.hose_timer_processor import HoseTimerProcessor
@@ -19,7 +20,6 @@ from RachioFlume.rachio_client import RachioClient
 from RachioFlume.rachio_hose_client import RachioHoseClient
 from RachioFlume.stale_zone_checker import StaleZoneChecker
 from lib.MyPushover import Pushover
-from RachioFlume.reporter import WeeklyReporter
 from lib.logger import get_logger
 from lib.config import get_config
 from datetime import datetime, timedelta
@@ -35,6 +35,25 @@ pushover = Pushover(
 )
 
 
+def _parse_report_date(value: str) -> datetime:
+    """argparse `type=` for YYYY-MM-DD dates, so handlers get a datetime."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date {value!r}, expected YYYY-MM-DD") from None
+
+
+def _parse_period_count(value: str) -> int:
+    """argparse `type=` for --periods: a whole number of at least 1."""
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid count {value!r}, expected an integer") from None
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"invalid count {count}, expected at least 1")
+    return count
+
+
 def main() -> int:
     """Main entry point with command line interface."""
     # Setup logging first
@@ -42,6 +61,18 @@ def main() -> int:
     logger.info("=" * 50)
     logger.info("Starting Rachio-Flume Water Tracking Integration")
 
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    return _COMMANDS[args.command](args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(description="Rachio-Flume Water Tracking Integration")
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -68,8 +99,9 @@ def main() -> int:
     report_parser = subparsers.add_parser("report", help="Generate period reports")
     report_parser.add_argument(
         "--end-date",
-        type=str,
-        default=datetime.now().strftime("%Y-%m-%d"),
+        type=_parse_report_date,
+        # Non-string defaults bypass `type`, so today's midnight is used as-is.
+        default=datetime.now().replace(hour=0, minute=0, second=0, microsecond=0),
         help="End date for report (YYYY-MM-DD format, defaults to today)",
     )
     report_parser.add_argument(
@@ -78,7 +110,21 @@ def main() -> int:
         default=7,
         help="Number of days to look back from end date (default: 7)",
     )
+    report_parser.add_argument(
+        "--periods",
+        type=_parse_period_count,
+        default=1,
+        help="Print N consecutive lookback-length reports ending at end date, oldest "
+        "first; --email/--save use the most recent (default: 1)",
+    )
     report_parser.add_argument("--email", action="store_true", help="Send report via email")
+    report_parser.add_argument(
+        "--save",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Also write the report as JSON to PATH",
+    )
 
     # Raw data command
     raw_parser = subparsers.add_parser("raw", help="Generate raw data report (5-minute intervals)")
@@ -119,26 +165,7 @@ def main() -> int:
     unmute_parser = alerts_sub.add_parser("unmute", help="Clear mute on a rule")
     unmute_parser.add_argument("rule", help="Rule name (e.g. 'Pipe Break')")
 
-    args = parser.parse_args()
-
-    if not args.command:
-        parser.print_help()
-        return 1
-
-    if args.command == "collect":
-        return run_collection(args)
-    elif args.command == "status":
-        return show_status(args)
-    elif args.command == "list-devices":
-        return list_devices(args)
-    elif args.command == "report":
-        return generate_report(args)
-    elif args.command == "raw":
-        return generate_raw_report(args)
-    elif args.command == "alerts":
-        return run_alerts_command(args)
-
-    return 0
+    return parser
 
 
 def _build_alert_engine() -> AlertEngine:
@@ -214,6 +241,9 @@ def run_collection(args: argparse.Namespace) -> int:
     """Run data collection."""
     logger = get_logger(__name__)
 
+    # Imported here so commands that never collect skip the collector stack.
+    from RachioFlume.collector import WaterTrackingCollector
+
     try:
         cfg = get_config()
         alert_engine = _build_alert_engine() if cfg.rachio_flume.alerts.enabled else None
@@ -324,6 +354,8 @@ def show_status(_args: argparse.Namespace) -> int:
     """Show current system status."""
     logger = get_logger(__name__)
 
+    from RachioFlume.collector import WaterTrackingCollector
+
     try:
         collector = WaterTrackingCollector(DB_PATH)
         status = collector.get_current_status()
@@ -370,18 +402,43 @@ def show_status(_args: argparse.Namespace) -> int:
 def generate_report(args: argparse.Namespace) -> int:
     """Generate reports."""
     logger = get_logger(__name__)
+    # Imported here so only the report commands load the reporter and mailer.
+    from RachioFlume.reporter import WeeklyReporter
 
     try:
         reporter = WeeklyReporter(DB_PATH)
 
-        end_date = datetime.strptime(args.end_date, "%Y-%m-%d")
-        start_date = end_date - timedelta(days=args.lookback)
-        report = reporter.generate_period_report_with_dates(start_date, end_date)
-        reporter.print_report(report)
-
-        if args.email:
-            reporter.email_report(report, alert=False)
-            logger.info("Report emailed")
+        end_date = args.end_date
+        span = timedelta(days=args.lookback)
+        periods = [
+            (end_date - span * (i + 1), end_date - span * i) for i in reversed(range(args.periods))
+        ]
+        # Reports arrive oldest first; the loop leaves the latest one bound
+        # for the save / email step below.
+        for report in reporter.generate_period_reports(periods):
+            # Format once; the log print and the email body share the same text.
+            report_text = reporter.format_report_text(report)
+            reporter.print_report(report, report_text)
+
+        # The JSON write and the SMTP send are independent and both I/O-bound,
+        # so run them side by side; .result() re-raises into the handler below.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            save_future = (
+                executor.submit(reporter.save_report_to_file, report, args.save)
+                if args.save
+                else None
+            )
+            email_future = (
+                executor.submit(reporter.email_report, report, False, report_text)
+                if args.email
+                else None
+            )
+            if save_future is not None:
+                save_future.result()
+                logger.info(f"Report saved to {args.save}")
+            if email_future is not None:
+                email_future.result()
+                logger.info("Report emailed")
 
         return 0
 
@@ -398,6 +455,7 @@ def generate_report(args: argparse.Namespace) -> int:
 def generate_raw_report(args: argparse.Namespace) -> int:
     """Generate raw data reports."""
     logger = get_logger(__name__)
+    from RachioFlume.reporter import WeeklyReporter
 
     try:
         reporter = WeeklyReporter(DB_PATH)
@@ -471,5 +529,16 @@ def run_alerts_command(args: argparse.Namespace) -> int:
     return 1
 
 
+# Subcommand name -> handler, dispatched from main().
+_COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "collect": run_collection,
+    "status": show_status,
+    "list-devices": list_devices,
+    "report": generate_report,
+    "raw": generate_raw_report,
+    "alerts": run_alerts_command,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,7 +6,8 @@ schedules, offline hose-timer hubs, dead valve batteries, etc.
 
 Dedup: at most one notification per zone per day (stored in metadata).
 Cadence: gated to once per hour from the collector cycle (no need to spam
-on every 5-minute poll).
+on every 5-minute poll). The last-run time is persisted in metadata and
+mirrored in memory, so in-process polls inside the hour skip the DB read.
 """
 
 from datetime import datetime, timedelta
@@ -34,6 +35,8 @@ class StaleZoneChecker:
         self.pushover = pushover
         self.stale_zone_days = stale_zone_days
         self.logger = get_logger(__name__)
+        # In-memory copy of the persisted last-run time (see maybe_evaluate).
+        self._last_run: Optional[datetime] = None
 
     def maybe_evaluate(self, *, dry_run: bool = False, now: Optional[datetime] = None) -> bool:
         """Run the stale-zone scan if at least 1 hour has elapsed since the
@@ -41,17 +44,21 @@ class StaleZoneChecker:
         """
         if now is None:
             now = datetime.now()
+        if self._last_run is not None and now - self._last_run < _CHECK_INTERVAL:
+            return False
         last_run_blob = self.db.get_metadata(_LAST_RUN_KEY)
         if last_run_blob:
             try:
                 last_run = datetime.fromisoformat(last_run_blob)
                 if now - last_run < _CHECK_INTERVAL:
+                    self._last_run = last_run
                     return False
             except ValueError:
                 pass  # corrupt timestamp — treat as never-run
         self.evaluate(dry_run=dry_run, now=now)
         if not dry_run:
             self.db.set_metadata(_LAST_RUN_KEY, now.isoformat())
+            self._last_run = now
         return True
 
     def evaluate(self, *, dry_run: bool = False, now: Optional[datetime] = None) -> list[dict]:
@@ -7,6 +7,7 @@ a fresh token on every auth call.
 """
 
 import json
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 import pytest
@@ -20,11 +21,14 @@ _DEVICES_PAYLOAD = {
 }
 
 
+@dataclass(slots=True)
 class FakeResponse:
-    def __init__(self, status_code: int = 200, payload: dict | None = None):
-        self.status_code = status_code
-        self._payload = payload or {}
-        self.text = json.dumps(self._payload)
+    status_code: int = 200
+    _payload: dict = field(default_factory=dict)
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self._payload)
 
     def json(self) -> dict:
         return self._payload
@@ -38,13 +42,18 @@ class FakeFlumeSession:
     """Scripted session: every `.post` (auth) mints token `tok<N>`; `.request`
     (API) pops the next scripted response and records the bearer used."""
 
-    def __init__(self, api_responses: list[FakeResponse]):
+    def __init__(
+        self, api_responses: list[FakeResponse], auth_response: FakeResponse | None = None
+    ):
         self.auth_calls = 0
         self.api_bearers: list[str] = []
         self._api_responses = list(api_responses)
+        self._auth_response = auth_response
 
     def post(self, url: str, json: dict | None = None, headers: dict | None = None) -> FakeResponse:
         self.auth_calls += 1
+        if self._auth_response is not None:
+            return self._auth_response
         return FakeResponse(
             200,
             {
@@ -124,47 +133,75 @@ def test_init_stores_credentials() -> None:
     assert client.password == "pw"  # nosecret
 
 
-def test_get_devices_parses_multiple_and_active_flag() -> None:
-    payload = {
-        "success": True,
-        "data": [
-            {"id": "device1", "type": 2, "connected": True, "location_id": None},
-            {"id": "device2", "type": 2, "connected": False, "location_id": None},
-        ],
-    }
-    client = _client(FakeFlumeSession([FakeResponse(200, payload)]))
-
-    devices = client.get_devices()
-
-    assert [d.id for d in devices] == ["device1", "device2"]
-    assert all("Water Sensor" in d.name for d in devices)
-    assert [d.active for d in devices] == [True, False]
+@pytest.mark.parametrize(
+    "auth_response, error",
+    [
+        (FakeResponse(400, {"success": False, "message": "invalid_grant"}), requests.HTTPError),
+        (FakeResponse(200, {"success": False, "detailed": "bad credentials"}), ValueError),
+        (FakeResponse(200, {"success": True, "data": []}), ValueError),
+    ],
+)
+def test_init_rejected_credentials_fail_locally(
+    auth_response: FakeResponse, error: type[Exception]
+) -> None:
+    session = FakeFlumeSession([], auth_response=auth_response)
 
+    with pytest.raises(error):
+        _client(session)
 
-def test_get_devices_skips_non_meter_bridge() -> None:
-    payload = {
-        "success": True,
-        "data": [
-            {"id": "bridge1", "type": 1, "connected": True, "location_id": None},
-            {"id": "meter1", "type": 2, "connected": True, "location_id": None},
-        ],
-    }
-    client = _client(FakeFlumeSession([FakeResponse(200, payload)]))
+    assert session.auth_calls == 1
 
-    devices = client.get_devices()
 
-    assert [d.id for d in devices] == ["meter1"]
+def _device(device_id: str, device_type: int = 2, connected: bool = True) -> dict:
+    return {"id": device_id, "type": device_type, "connected": connected, "location_id": None}
+
+
+def _devices_responses(
+    devices: list[dict], location_status: int | None = None
+) -> list[FakeResponse]:
+    """Scripted responses for one get_devices() call: the device listing, plus
+    a bare location lookup response when `location_status` is given."""
+    responses = [FakeResponse(200, {"success": True, "data": devices})]
+    if location_status is not None:
+        responses.append(FakeResponse(location_status))
+    return responses
+
+
+@pytest.mark.parametrize(
+    ("devices", "expected_ids", "expected_active"),
+    [
+        pytest.param(
+            [_device("device1"), _device("device2", connected=False)],
+            ["device1", "device2"],
+            [True, False],
+            id="multiple-with-active-flag",
+        ),
+        pytest.param(
+            [_device("bridge1", device_type=1), _device("meter1")],
+            ["meter1"],
+            [True],
+            id="skips-non-meter-bridge",
+        ),
+    ],
+)
+def test_devices_parsing(
+    devices: list[dict], expected_ids: list[str], expected_active: list[bool]
+) -> None:
+    client = _client(FakeFlumeSession(_devices_responses(devices)))
+
+    parsed = client.get_devices()
+
+    assert [d.id for d in parsed] == expected_ids
+    assert all("Water Sensor" in d.name for d in parsed)
+    assert [d.active for d in parsed] == expected_active
 
 
 def test_get_devices_survives_location_404() -> None:
     """A failing location lookup must not break device enumeration — the
     HTTPError raised by _request is swallowed by get_devices' existing
     fallback and devices keep their default naming."""
-    payload = {
-        "success": True,
-        "data": [{"id": "dev1", "type": 2, "connected": True, "location_id": 42}],
-    }
-    client = _client(FakeFlumeSession([FakeResponse(200, payload), FakeResponse(404)]))
+    located = {**_device("dev1"), "location_id": 42}
+    client = _client(FakeFlumeSession(_devices_responses([located], location_status=404)))
 
     devices = client.get_devices()
 
@@ -183,9 +220,10 @@ def test_get_usage_parses_readings() -> None:
             }
         ]
     }
-    client = _client(
-        FakeFlumeSession([FakeResponse(200, _DEVICES_PAYLOAD), FakeResponse(200, usage_payload)])
+    session = FakeFlumeSession(
+        _devices_responses([_device("dev1")]) + [FakeResponse(200, usage_payload)]
     )
+    client = _client(session)
 
     readings = client.get_usage(datetime(2023, 1, 1, 10, 0), datetime(2023, 1, 1, 10, 2))
 
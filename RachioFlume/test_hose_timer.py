@@ -1,10 +1,8 @@
 """Tests for the Rachio Smart Hose Timer integration."""
 
 import json
-import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any, Dict, Iterator
+from typing import Any, Dict
 from unittest.mock import MagicMock
 
 import pytest
@@ -20,13 +18,8 @@ from RachioFlume.rachio_hose_client import HoseValve, RachioHoseClient
 
 
 @pytest.fixture
-def tmp_db() -> Iterator[WaterTrackingDB]:
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
-    try:
-        yield WaterTrackingDB(path)
-    finally:
-        Path(path).unlink(missing_ok=True)
+def tmp_db(db_path: str) -> WaterTrackingDB:
+    return WaterTrackingDB(db_path)
 
 
 def _valve(action: Dict[str, Any] | None = None) -> HoseValve:
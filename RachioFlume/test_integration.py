@@ -1,65 +1,131 @@
 """Tests for the Rachio-Flume water tracking integration."""
 
 import pytest
-import tempfile
+import json
+import requests
+from dataclasses import dataclass
 from datetime import datetime
-from unittest.mock import Mock, patch
-import os
+from unittest.mock import Mock
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
 
 from RachioFlume.rachio_client import RachioClient, Zone, WateringEvent
 from RachioFlume.flume_client import WaterReading
 from RachioFlume.data_storage import WaterTrackingDB
 from RachioFlume.collector import WaterTrackingCollector
-from RachioFlume.reporter import WeeklyReporter
+from RachioFlume.rfmanager import _build_parser
+from RachioFlume.reporter import (
+    ReportSummary,
+    WaterUsageReport,
+    WeeklyReporter,
+    ZoneStats,
+)
+
+
+@dataclass(slots=True)
+class FakeRachioResponse:
+    _payload: Dict[str, Any]
+    status_code: int = 200
+
+    def json(self) -> Dict[str, Any]:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Client Error")
+
+
+class FakeRachioSession:
+    """Serves canned JSON by URL; unknown URLs fail loudly."""
+
+    def __init__(self, payloads: Dict[str, Dict[str, Any]]):
+        self._responses = {url: FakeRachioResponse(p) for url, p in payloads.items()}
+
+    def get(self, url: str, **kwargs: Any) -> FakeRachioResponse:
+        return self._responses[url]
+
+
+def _seed_zone_sessions(db: WaterTrackingDB, rows: List[Tuple[Any, ...]]) -> None:
+    """Insert (zone_name, zone_number, start, end, duration_s, gallons, gpm) rows."""
+    with db.get_connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO zone_sessions
+            (zone_name, zone_number, start_time, end_time, duration_seconds,
+             total_water_used, average_flow_rate)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.commit()
 
 
 class TestRachioClient:
     """Test Rachio API client."""
 
-    def test_init_with_env_vars(self) -> None:
-        """Test initialization with provided credentials."""
-        client = RachioClient(api_key="test_key", device_id="test_device")  # nosecret
-        assert client.api_key == "test_key"  # nosecret
-        assert client.device_id == "test_device"
-
-    @patch("RachioFlume.rachio_client.get_config")
-    def test_init_missing_credentials(self, mock_config: Mock) -> None:
-        """Test initialization fails without credentials."""
-        # Mock config: empty api_key, but one controller device so we exercise
-        # the api_key check rather than the no-devices path.
-        mock_config.return_value = Mock(
-            rachio=Mock(
+    @pytest.mark.parametrize(
+        "api_key, device_id, expected_device, error",
+        [
+            ("test_key", "test_device", "test_device", None),  # nosecret
+            ("test_key", None, "dev1", None),  # nosecret
+            (None, None, None, "Rachio API key required"),
+        ],
+    )
+    def test_init(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        api_key: Optional[str],
+        device_id: Optional[str],
+        expected_device: Optional[str],
+        error: Optional[str],
+    ) -> None:
+        """Explicit credentials win; otherwise fall back to config, which has
+        an empty api_key but one controller device (so a missing key hits the
+        api_key check rather than the no-devices path)."""
+        config = SimpleNamespace(
+            rachio=SimpleNamespace(
                 api_key="",
-                devices=[Mock(id="dev1", label="Test", type="controller")],
+                devices=[SimpleNamespace(id="dev1", label="Test", type="controller")],
             )
         )
-        with pytest.raises(ValueError, match="Rachio API key required"):
-            RachioClient()
-
-    @patch("RachioFlume.rachio_client.requests.get")
-    def test_get_zones(self, mock_get: Mock) -> None:
+        monkeypatch.setattr("RachioFlume.rachio_client.get_config", lambda: config)
+        if error:
+            with pytest.raises(ValueError, match=error):
+                RachioClient(api_key=api_key, device_id=device_id)
+            return
+        client = RachioClient(api_key=api_key, device_id=device_id)
+        assert client.api_key == api_key
+        assert client.device_id == expected_device
+
+    def test_get_zones(self) -> None:
         """Test getting zones from device."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "zones": [
-                {
-                    "id": "zone1",
-                    "zoneNumber": 1,
-                    "name": "Front Yard",
-                    "enabled": True,
-                },
-                {
-                    "id": "zone2",
-                    "zoneNumber": 2,
-                    "name": "Back Yard",
-                    "enabled": False,
-                },
-            ]
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        client = RachioClient(api_key="test_key", device_id="test_device")  # nosecret
+        session = FakeRachioSession(
+            {
+                "https://api.rach.io/1/public/device/test_device": {
+                    "zones": [
+                        {
+                            "id": "zone1",
+                            "zoneNumber": 1,
+                            "name": "Front Yard",
+                            "enabled": True,
+                        },
+                        {
+                            "id": "zone2",
+                            "zoneNumber": 2,
+                            "name": "Back Yard",
+                            "enabled": False,
+                        },
+                    ]
+                }
+            }
+        )
+
+        client = RachioClient(
+            api_key="test_key",  # nosecret
+            device_id="test_device",
+            session=session,  # type: ignore[arg-type]
+        )
         zones = client.get_zones()
 
         assert len(zones) == 2
@@ -78,156 +144,376 @@ class TestRachioClient:
 class TestWaterTrackingDB:
     """Test database operations."""
 
-    def test_init_creates_tables(self) -> None:
+    def test_init_creates_tables(self, memory_db: WaterTrackingDB) -> None:
         """Test database initialization creates required tables."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db = WaterTrackingDB(tmp.name)
-
-            # Check that tables exist
-            with db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT name FROM sqlite_master 
-                    WHERE type='table' AND name IN ('zones', 'watering_events', 'water_readings', 'zone_sessions')
-                """
-                )
-                tables = [row[0] for row in cursor.fetchall()]
+        tables = memory_db.list_tables()
 
-                assert "zones" in tables
-                assert "watering_events" in tables
-                assert "water_readings" in tables
-                assert "zone_sessions" in tables
+        assert "zones" in tables
+        assert "watering_events" in tables
+        assert "water_readings" in tables
+        assert "zone_sessions" in tables
 
-            os.unlink(tmp.name)
-
-    def test_save_and_retrieve_zones(self) -> None:
+    def test_save_and_retrieve_zones(self, memory_db: WaterTrackingDB) -> None:
         """Test saving and retrieving zones."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db = WaterTrackingDB(tmp.name)
-
-            zones = [
-                Zone(id="zone1", zone_number=1, name="Front Yard", enabled=True),
-                Zone(id="zone2", zone_number=2, name="Back Yard", enabled=False),
-            ]
+        db = memory_db
 
-            db.save_zones(zones)
+        zones = [
+            Zone(id="zone1", zone_number=1, name="Front Yard", enabled=True),
+            Zone(id="zone2", zone_number=2, name="Back Yard", enabled=False),
+        ]
 
-            # Retrieve and verify
-            with db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM zones ORDER BY zone_number")
-                rows = cursor.fetchall()
+        db.save_zones(zones)
 
-                assert len(rows) == 2
-                assert rows[0]["name"] == "Front Yard"
-                assert rows[0]["enabled"] == 1  # SQLite stores as integer
-                assert rows[1]["name"] == "Back Yard"
-                assert rows[1]["enabled"] == 0
+        rows = db.get_zones()
 
-            os.unlink(tmp.name)
+        assert len(rows) == 2
+        assert rows[0]["name"] == "Front Yard"
+        assert rows[0]["enabled"] == 1  # SQLite stores as integer
+        assert rows[1]["name"] == "Back Yard"
+        assert rows[1]["enabled"] == 0
 
-    def test_compute_zone_sessions(self) -> None:
+    def test_compute_zone_sessions(self, memory_db: WaterTrackingDB) -> None:
         """Test computing zone sessions from events."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db = WaterTrackingDB(tmp.name)
-
-            # Create sample events
-            start_time = datetime(2023, 1, 1, 10, 0)
-            end_time = datetime(2023, 1, 1, 10, 30)
-
-            events = [
-                WateringEvent(
-                    event_date=start_time,
-                    zone_name="Front Yard",
-                    zone_number=1,
-                    event_type="ZONE_STARTED",
-                ),
-                WateringEvent(
-                    event_date=end_time,
-                    zone_name="Front Yard",
-                    zone_number=1,
-                    event_type="ZONE_COMPLETED",
-                    duration_seconds=1800,
-                ),
-            ]
+        db = memory_db
+
+        # Create sample events
+        start_time = datetime(2023, 1, 1, 10, 0)
+        end_time = datetime(2023, 1, 1, 10, 30)
+
+        events = [
+            WateringEvent(
+                event_date=start_time,
+                zone_name="Front Yard",
+                zone_number=1,
+                event_type="ZONE_STARTED",
+            ),
+            WateringEvent(
+                event_date=end_time,
+                zone_name="Front Yard",
+                zone_number=1,
+                event_type="ZONE_COMPLETED",
+                duration_seconds=1800,
+            ),
+        ]
+
+        db.save_watering_events(events)
+        db.compute_zone_sessions()
+
+        # Check computed sessions
+        sessions = db.get_zone_sessions(datetime(2023, 1, 1), datetime(2023, 1, 2))
+
+        assert len(sessions) == 1
+        assert sessions[0]["zone_name"] == "Front Yard"
+        assert sessions[0]["duration_seconds"] == 1800
 
-            db.save_watering_events(events)
-            db.compute_zone_sessions()
+    def test_period_zone_stats_counts_threshold_alerts(self, db_path: str) -> None:
+        """alert_sessions counts only sessions above that zone's GPM ceiling."""
+        db = WaterTrackingDB(db_path)
 
-            # Check computed sessions
-            sessions = db.get_zone_sessions(datetime(2023, 1, 1), datetime(2023, 1, 2))
+        _seed_zone_sessions(
+            db,
+            [
+                ("Front Yard", 1, datetime(2023, 1, 3, 6), datetime(2023, 1, 3, 7), 600, 10, 1.0),
+                ("Front Yard", 1, datetime(2023, 1, 4, 6), datetime(2023, 1, 4, 7), 600, 30, 3.0),
+                ("Back Yard", 2, datetime(2023, 1, 4, 8), datetime(2023, 1, 4, 9), 600, 50, 5.0),
+            ],
+        )
+
+        start, end = datetime(2023, 1, 2), datetime(2023, 1, 9)
+        stats = db.get_period_zone_stats(start, end, {"1": 2.0})
+        assert [(s["zone_number"], s["alert_sessions"]) for s in stats] == [(1, 1), (2, 0)]
+
+        unthresholded = db.get_period_zone_stats(start, end)
+        assert [s["alert_sessions"] for s in unthresholded] == [0, 0]
+
+    def test_hose_period_stats_order_by_compact_label_then_first_run(self, db_path: str) -> None:
+        """Hose rows sort like the report's old (zone_number, compact label) sort:
+        by compact label, with ties left in order of first run."""
+        db = WaterTrackingDB(db_path)
+
+        for day, valve, label in (
+            (3, " Z9 - Beds", "Hose Drip"),
+            (5, "Z1 - Roses", "Yard B"),
+            (6, "Z1 - Roses", "Yard A"),
+        ):
+            db.save_hose_zone_session(
+                {
+                    "valve_id": f"{label}/{valve}",
+                    "base_station_id": label,
+                    "valve_name": valve,
+                    "base_station_label": label,
+                    "start_time": datetime(2023, 1, day, 6, 0),
+                    "end_time": datetime(2023, 1, day, 6, 10),
+                    "duration_seconds": 600,
+                    "total_water_used": 10.0,
+                }
+            )
+
+        stats = db.get_hose_period_stats(datetime(2023, 1, 2), datetime(2023, 1, 9))
+        assert [(s["base_station_label"], s["valve_name"]) for s in stats] == [
+            ("Yard B", "Z1 - Roses"),
+            ("Yard A", "Z1 - Roses"),
+            ("Hose Drip", " Z9 - Beds"),
+        ]
 
-            assert len(sessions) == 1
-            assert sessions[0]["zone_name"] == "Front Yard"
-            assert sessions[0]["duration_seconds"] == 1800
+    def test_hose_period_stats_counts_threshold_alerts(self, db_path: str) -> None:
+        """Hose alert_sessions compares each session's own GPM to its valve's ceiling."""
+        db = WaterTrackingDB(db_path)
+
+        # 10 min runs: 10 gal -> 1.0 GPM, 30 gal -> 3.0 GPM; zero-length run never alerts
+        for day, valve, gallons, seconds in (
+            (3, "Z13 FS - Planters", 10.0, 600),
+            (4, "Z13 FS - Planters", 30.0, 600),
+            (5, "Z13 FS - Planters", 30.0, 0),
+            (4, "Z14 BS - Roses", 30.0, 600),
+        ):
+            db.save_hose_zone_session(
+                {
+                    "valve_id": valve,
+                    "base_station_id": "bs1",
+                    "valve_name": valve,
+                    "base_station_label": "Hose Drip",
+                    "start_time": datetime(2023, 1, day, 6, 0),
+                    "end_time": datetime(2023, 1, day, 6, 10),
+                    "duration_seconds": seconds,
+                    "total_water_used": gallons,
+                }
+            )
 
-            os.unlink(tmp.name)
+        start, end = datetime(2023, 1, 2), datetime(2023, 1, 9)
+        stats = db.get_hose_period_stats(start, end, {("Hose Drip", "Z13 FS - Planters"): 2.0})
+        assert [(s["valve_name"], s["alert_sessions"]) for s in stats] == [
+            ("Z13 FS - Planters", 1),
+            ("Z14 BS - Roses", 0),
+        ]
+        assert [s["alert_sessions"] for s in db.get_hose_period_stats(start, end)] == [0, 0]
 
 
 class TestWeeklyReporter:
     """Test weekly reporting functionality."""
 
-    def test_generate_weekly_report(self) -> None:
+    def test_generate_weekly_report(self, db_path: str) -> None:
         """Test generating a weekly report."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            db = WaterTrackingDB(tmp.name)
-            reporter = WeeklyReporter(tmp.name)
-
-            # Create sample data
-            with db.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO zone_sessions 
-                    (zone_name, zone_number, start_time, end_time, duration_seconds, total_water_used, average_flow_rate)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        "Front Yard",
-                        1,
-                        "2023-01-02 10:00:00",
-                        "2023-01-02 10:30:00",
-                        1800,
-                        50.0,
-                        1.67,
-                    ),
+        db = WaterTrackingDB(db_path)
+        reporter = WeeklyReporter(db_path)
+
+        # Create sample data
+        _seed_zone_sessions(
+            db,
+            [
+                (
+                    "Front Yard",
+                    1,
+                    "2023-01-02 10:00:00",
+                    "2023-01-02 10:30:00",
+                    1800,
+                    50.0,
+                    1.67,
                 )
-                conn.commit()
+            ],
+        )
+
+        # Generate report
+        period_start = datetime(2023, 1, 2)  # Monday
+        period_end = datetime(2023, 1, 9)  # Next Monday
+        report = reporter.generate_period_report_with_dates(period_start, period_end)
+
+        assert report.summary.total_watering_sessions == 1
+        assert report.summary.total_duration_minutes == 30.0
+        assert report.summary.total_water_used_gallons == 50.0
+        assert len(report.zones) == 1
+        assert report.zones[0].zone_name == "Front Yard"
+
+    def test_format_report_text_zone_rows(self) -> None:
+        """Zone rows stay column-aligned under the fixed-width header."""
+        report = WaterUsageReport(
+            report_generated=datetime(2023, 1, 9),
+            period_start=datetime(2023, 1, 2),
+            period_end=datetime(2023, 1, 9),
+            summary=ReportSummary(
+                total_watering_sessions=3,
+                total_duration_minutes=50.5,
+                total_water_used_gallons=123.4,
+                zones_watered=2,
+            ),
+            zones=[
+                ZoneStats(1, "Front Yard Long", 2, 30.0, 15.0, 50.4, 1.67, 2.5, 1),
+                ZoneStats(999, "Z13 FS", 1, 20.5, 20.5, 73.0, 3.56, 0.0, 0),
+            ],
+        )
+        reporter = WeeklyReporter.__new__(WeeklyReporter)  # formatting needs no DB
+
+        lines = reporter.format_report_text(report).split("\n")
+
+        header = lines.index("Name        Min  Gals   GPM   Thr Alrt")
+        assert lines[header + 2] == "Front Ya   30.0    50   1.7   2.5    1"
+        assert lines[header + 3] == "Z13 FS     20.5    73   3.6     -    -"
+        assert "  Total water used: 123 gallons" in lines
+
+    def test_hose_sessions_aggregate_per_valve(self, db_path: str) -> None:
+        """Hose-timer sessions collapse into one row per (base station, valve)."""
+        db = WaterTrackingDB(db_path)
+        reporter = WeeklyReporter(db_path)
+
+        for day, gallons in ((3, 12.0), (4, 8.0)):
+            db.save_hose_zone_session(
+                {
+                    "valve_id": "v1",
+                    "base_station_id": "bs1",
+                    "valve_name": "Z13 FS - Upper Deck Planters",
+                    "base_station_label": "Hose Drip",
+                    "start_time": datetime(2023, 1, day, 6, 0),
+                    "end_time": datetime(2023, 1, day, 6, 10),
+                    "duration_seconds": 600,
+                    "total_water_used": gallons,
+                }
+            )
+
+        report = reporter.generate_period_report_with_dates(
+            datetime(2023, 1, 2), datetime(2023, 1, 9)
+        )
+
+        assert len(report.zones) == 1
+        hose = report.zones[0]
+        assert hose.zone_name == "Z13 FS"
+        assert hose.sessions == 2
+        assert hose.total_duration_minutes == 20.0
+        assert hose.average_duration_minutes == 10.0
+        assert hose.total_water_gallons == 20.0
+        assert hose.average_flow_rate_gpm == 1.0
+        assert report.summary.zones_watered == 1
+
+    def test_hose_flow_rounds_to_one_decimal(self, db_path: str) -> None:
+        """Hose valve GPM keeps its one-decimal rounding (12.4 gal / 10 min -> 1.2)."""
+        db = WaterTrackingDB(db_path)
+        reporter = WeeklyReporter(db_path)
+        db.save_hose_zone_session(
+            {
+                "valve_id": "v1",
+                "base_station_id": "bs1",
+                "valve_name": "Z13 FS - Upper Deck Planters",
+                "base_station_label": "Hose Drip",
+                "start_time": datetime(2023, 1, 3, 6, 0),
+                "end_time": datetime(2023, 1, 3, 6, 10),
+                "duration_seconds": 600,
+                "total_water_used": 12.4,
+            }
+        )
+
+        report = reporter.generate_period_report_with_dates(
+            datetime(2023, 1, 2), datetime(2023, 1, 9)
+        )
 
-            # Generate report
-            period_start = datetime(2023, 1, 2)  # Monday
-            period_end = datetime(2023, 1, 9)  # Next Monday
-            report = reporter.generate_period_report_with_dates(period_start, period_end)
+        assert report.zones[0].average_flow_rate_gpm == 1.2
 
-            assert report.summary.total_watering_sessions == 1
-            assert report.summary.total_duration_minutes == 30.0
-            assert report.summary.total_water_used_gallons == 50.0
-            assert len(report.zones) == 1
-            assert report.zones[0].zone_name == "Front Yard"
+    def test_report_rows_ordered_without_resort(self, db_path: str) -> None:
+        """Controller zones by number, then hose valves by name; totals span both."""
+        db = WaterTrackingDB(db_path)
+        reporter = WeeklyReporter(db_path)
 
-            os.unlink(tmp.name)
+        _seed_zone_sessions(
+            db,
+            [
+                ("Back Yard", 2, datetime(2023, 1, 3, 6), datetime(2023, 1, 3, 7), 600, 20.0, 2.0),
+                ("Front Yard", 1, datetime(2023, 1, 4, 6), datetime(2023, 1, 4, 7), 600, 20.0, 2.0),
+            ],
+        )
+
+        # Later-named valve runs first, so ordering can't come from start_time.
+        for day, valve in ((3, "Z14 BS - Roses"), (5, "Z13 FS - Upper Deck Planters")):
+            db.save_hose_zone_session(
+                {
+                    "valve_id": valve,
+                    "base_station_id": "bs1",
+                    "valve_name": valve,
+                    "base_station_label": "Hose Drip",
+                    "start_time": datetime(2023, 1, day, 6, 0),
+                    "end_time": datetime(2023, 1, day, 6, 10),
+                    "duration_seconds": 600,
+                    "total_water_used": 10.0,
+                }
+            )
+
+        report = reporter.generate_period_report_with_dates(
+            datetime(2023, 1, 2), datetime(2023, 1, 9)
+        )
+
+        assert [z.zone_name for z in report.zones] == [
+            "Front Yard",
+            "Back Yard",
+            "Z13 FS",
+            "Z14 BS",
+        ]
+        assert report.summary.total_watering_sessions == 4
+        assert report.summary.total_duration_minutes == 40.0
+        assert report.summary.total_water_used_gallons == 60.0
+
+    def test_generate_period_reports_in_order(self, db_path: str) -> None:
+        """Prefetched reports come back in the order their periods were given."""
+        db = WaterTrackingDB(db_path)
+        reporter = WeeklyReporter(db_path)
+
+        _seed_zone_sessions(
+            db,
+            [
+                ("Front Yard", 1, datetime(2023, 1, 3, 6), datetime(2023, 1, 3, 7), 600, 10.0, 2.0),
+                (
+                    "Front Yard",
+                    1,
+                    datetime(2023, 1, 10, 6),
+                    datetime(2023, 1, 10, 7),
+                    600,
+                    20.0,
+                    2.0,
+                ),
+            ],
+        )
+
+        periods = [
+            (datetime(2023, 1, 2), datetime(2023, 1, 9)),
+            (datetime(2023, 1, 9), datetime(2023, 1, 16)),
+            (datetime(2023, 1, 16), datetime(2023, 1, 23)),
+        ]
+        reports = list(reporter.generate_period_reports(periods))
+
+        assert [(r.period_start, r.period_end) for r in reports] == periods
+        assert [r.summary.total_water_used_gallons for r in reports] == [10.0, 20.0, 0.0]
+        assert list(reporter.generate_period_reports([])) == []
+
+    def test_save_report_to_file_writes_json(self, tmp_path: Path, db_path: str) -> None:
+        """Saved report is indented JSON with str()-formatted datetimes."""
+        report = WaterUsageReport(
+            report_generated=datetime(2023, 1, 9, 8, 30),
+            period_start=datetime(2023, 1, 2),
+            period_end=datetime(2023, 1, 9),
+            summary=ReportSummary(1, 30.0, 50.0, 1),
+            zones=[ZoneStats(1, "Front Yard", 1, 30.0, 30.0, 50.0, 1.67, 0.0, 0)],
+        )
+        out = tmp_path / "reports" / "latest.json"
+        reporter = WeeklyReporter(db_path)
+        reporter.save_report_to_file(report, str(out))
+        reporter.save_report_to_file(report, str(out.with_name("again.json")))
+        assert reporter._ensured_dirs == {out.parent}
+
+        text = out.read_text()
+        assert text.startswith('{\n  "report_generated": "2023-01-09 08:30:00"')
+        saved = json.loads(text)
+        assert saved["period_start"] == "2023-01-02 00:00:00"
+        assert saved["summary"]["total_water_used_gallons"] == 50.0
+        assert saved["zones"][0]["zone_name"] == "Front Yard"
 
 
 class TestWaterTrackingCollector:
     """Test the data collection service."""
 
-    @patch("RachioFlume.collector.RachioClient")
-    @patch("RachioFlume.collector.FlumeClient")
-    def test_collector_initialization(self, mock_flume: Mock, mock_rachio: Mock) -> None:
+    def test_collector_initialization(self, db_path: str) -> None:
         """Test collector initializes correctly."""
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            collector = WaterTrackingCollector(tmp.name)
+        collector = WaterTrackingCollector(db_path, rachio_client=Mock(), flume_client=Mock())
 
-            assert collector.db is not None
-            assert collector.poll_interval == 300  # Default 5 minutes
+        assert collector.db is not None
+        assert collector.poll_interval == 300  # Default 5 minutes
 
-            os.unlink(tmp.name)
-
-    @pytest.mark.asyncio
-    @patch("RachioFlume.collector.RachioClient")
-    @patch("RachioFlume.collector.FlumeClient")
-    async def test_collect_once(self, mock_flume_class: Mock, mock_rachio_class: Mock) -> None:
+    async def test_collect_once(self, db_path: str) -> None:
         """Test single collection cycle."""
         # Setup mocks
         mock_rachio = Mock()
@@ -235,22 +521,29 @@ class TestWaterTrackingCollector:
             Zone(id="zone1", zone_number=1, name="Test Zone", enabled=True)
         ]
         mock_rachio.get_recent_events.return_value = []
-        mock_rachio_class.return_value = mock_rachio
 
         mock_flume = Mock()
         mock_flume.get_usage.return_value = [WaterReading(timestamp=datetime.now(), value=1.0)]
-        mock_flume_class.return_value = mock_flume
 
-        with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as tmp:
-            collector = WaterTrackingCollector(tmp.name)
+        collector = WaterTrackingCollector(
+            db_path, rachio_client=mock_rachio, flume_client=mock_flume
+        )
+
+        await collector.collect_once()
+
+        # Verify methods were called
+        mock_rachio.get_zones.assert_called_once()
+        mock_flume.get_usage.assert_called()
 
-            await collector.collect_once()
 
-            # Verify methods were called
-            mock_rachio.get_zones.assert_called_once()
-            mock_flume.get_usage.assert_called()
+class TestReportArguments:
+    @pytest.mark.parametrize("value", ["0", "-2", "x"])
+    def test_periods_rejects_non_positive(self, value: str) -> None:
+        with pytest.raises(SystemExit):
+            _build_parser().parse_args(["report", "--periods", value])
 
-            os.unlink(tmp.name)
+    def test_periods_accepts_positive(self) -> None:
+        assert _build_parser().parse_args(["report", "--periods", "3"]).periods == 3
 
 
 if __name__ == "__main__":
@@ -1,9 +1,6 @@
 """Tests for the stale-zone checker."""
 
-import tempfile
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Iterator
 from unittest.mock import MagicMock
 
 import pytest
@@ -13,13 +10,8 @@ from RachioFlume.stale_zone_checker import StaleZoneChecker, _LAST_RUN_KEY
 
 
 @pytest.fixture
-def tmp_db() -> Iterator[WaterTrackingDB]:
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
-    try:
-        yield WaterTrackingDB(path)
-    finally:
-        Path(path).unlink(missing_ok=True)
+def tmp_db(db_path: str) -> WaterTrackingDB:
+    return WaterTrackingDB(db_path)
 
 
 def _seed_controller_zone(
@@ -166,6 +158,18 @@ class TestStaleZoneChecker:
         # Call 65 min later — runs again
         assert checker.maybe_evaluate(now=now + timedelta(minutes=65)) is True
 
+    def test_maybe_evaluate_gate_cached_in_memory(self, tmp_db: WaterTrackingDB) -> None:
+        now = datetime(2026, 6, 28, 8, 0, 0)
+        checker = StaleZoneChecker(tmp_db, MagicMock(), stale_zone_days=7)
+        assert checker.maybe_evaluate(now=now) is True
+        # Gate holds from memory even with the persisted timestamp gone
+        tmp_db.delete_metadata(_LAST_RUN_KEY)
+        assert checker.maybe_evaluate(now=now + timedelta(minutes=30)) is False
+        # A fresh checker (e.g. after restart) falls back to the DB copy
+        tmp_db.set_metadata(_LAST_RUN_KEY, now.isoformat())
+        fresh = StaleZoneChecker(tmp_db, MagicMock(), stale_zone_days=7)
+        assert fresh.maybe_evaluate(now=now + timedelta(minutes=30)) is False
+
     def test_dry_run_does_not_send_or_persist(self, tmp_db: WaterTrackingDB) -> None:
         now = datetime(2026, 6, 28, 8, 0, 0)
         _seed_controller_zone(tmp_db, 1, "Z1")
@@ -3,6 +3,9 @@
 
 import argparse
 import hashlib
+import io
+import json
+import math
 import os
 import random
 import re
@@ -11,13 +14,15 @@ import signal
 import sys
 import tempfile
 import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from types import FrameType
-from typing import Any, List, Dict, Optional
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 
 import pillow_heif
-from PIL import Image, ImageOps
+from PIL import ExifTags, Image, ImageOps
 from pydantic import BaseModel
 from tenacity import retry, stop_after_attempt, wait_exponential
 from SamsungFrame.samsung_client import SamsungFrameClient, ImageUploadSummary
@@ -35,8 +40,15 @@ pushover = Pushover(
     cfg.pushover.tokens.get("SamsungFrame", cfg.pushover.default_token),
 )
 
+IMAGE_EXTENSIONS = frozenset({".heic", ".jpg", ".jpeg", ".png"})
+
 # Thumbnail patterns to exclude
 THUMBNAIL_PATTERNS = re.compile(r"_(thumb|thumbnail|small)(@\d+x)?\.[\w]+$", re.IGNORECASE)
+# Substrings any THUMBNAIL_PATTERNS match contains (lowercased); cheap pre-check
+_THUMBNAIL_TOKENS = ("_thumb", "_small")
+
+# EXIF orientations whose transpose swaps width and height
+_SWAPPED_ORIENTATIONS = frozenset({5, 6, 7, 8})
 
 # Global state for signal handler
 _current_summary: Optional["BatchUploadSummary"] = None
@@ -89,7 +101,8 @@ def _send_interrupt_notification(_signum: int, _frame: Optional[FrameType]) -> N
     sys.exit(1)
 
 
-class ConversionResult(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ConversionResult:
     """Result of a single image conversion."""
 
     source_path: str
@@ -111,6 +124,7 @@ class BatchUploadSummary(BaseModel):
     art_deleted: int
     art_delete_failures: int
     total_art_on_tv: int
+    already_on_tv: int
     upload_summary: ImageUploadSummary
     conversion_errors: List[Dict[str, str]]
 
@@ -121,24 +135,93 @@ class ImageConverter:
     MAX_WIDTH = 3840
     MAX_HEIGHT = 2160
     JPG_QUALITY = 95
-
-    def __init__(self, temp_dir: str):
+    MIN_JPG_QUALITY = 70
+    PROGRESSIVE = True  # ~10% smaller than baseline at the same quality
+
+    def __init__(self, temp_dir: str, cache_dir: Optional[str] = None):
+        """
+        Args:
+            temp_dir: Directory converted images are written to
+            cache_dir: Optional directory reusing converted images across runs
+        """
         self.temp_dir = Path(temp_dir)
         self.logger = get_logger(f"{__name__}.ImageConverter")
         cfg = get_config()
-        self.max_size_mb = cfg.samsung_frame.max_image_size_mb
+        self.max_size_mb: float = cfg.samsung_frame.max_image_size_mb
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def convert_if_needed(self, image_path: Path) -> ConversionResult:
-        """Downsize to 4K and compress under max_image_size_mb. Convert HEIC to JPG."""
-        original_size_mb = image_path.stat().st_size / (1024 * 1024)
+        """Downsize to 4K and compress under max_image_size_mb. Convert HEIC to JPG.
+
+        With a cache_dir, a source whose path, mtime and size match an earlier
+        conversion reuses that output instead of decoding again.
+        """
+        stat = image_path.stat()
+        cache_key = self._cache_key(image_path, stat) if self.cache_dir else None
+        if cache_key:
+            cached = self._from_cache(image_path, cache_key, stat.st_size)
+            if cached:
+                return cached
+
+        result = self._convert(image_path, stat.st_size / (1024 * 1024))
+        if cache_key and result.success and result.converted_path:
+            self._store_in_cache(Path(result.converted_path), cache_key)
+        return result
+
+    def _cache_key(self, image_path: Path, stat: os.stat_result) -> str:
+        # Conversion settings are part of the key so changing them invalidates entries
+        ident = (
+            f"{image_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|"
+            f"{self.MAX_WIDTH}x{self.MAX_HEIGHT}|{self.JPG_QUALITY}|{self.max_size_mb}|"
+            f"{self.PROGRESSIVE}"
+        )
+        return hashlib.blake2b(os.fsencode(ident), digest_size=16).hexdigest()
+
+    def _from_cache(
+        self, image_path: Path, cache_key: str, source_size: int
+    ) -> Optional[ConversionResult]:
+        assert self.cache_dir is not None
+        for suffix in (".jpg", ".png"):
+            cached = self.cache_dir / f"{cache_key}{suffix}"
+            output_path = self.temp_dir / f"{image_path.stem}_{_name_tag(image_path)}{suffix}"
+            try:
+                _link_or_copy(cached, output_path)
+            except FileNotFoundError:
+                continue
+            os.utime(cached)  # mtime marks last use for trim_conversion_cache
+            self.logger.debug(f"Conversion cache hit for {image_path.name}")
+            return ConversionResult(
+                source_path=str(image_path),
+                converted_path=str(output_path),
+                success=True,
+                original_size_mb=source_size / (1024 * 1024),
+                converted_size_mb=output_path.stat().st_size / (1024 * 1024),
+            )
+        return None
+
+    def _store_in_cache(self, converted: Path, cache_key: str) -> None:
+        assert self.cache_dir is not None
+        cached = self.cache_dir / f"{cache_key}{converted.suffix}"
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        try:
+            _link_or_copy(converted, tmp)
+            os.replace(tmp, cached)  # atomic: concurrent workers never see partial files
+        except OSError as e:
+            self.logger.warning(f"Could not cache {converted.name}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _convert(self, image_path: Path, original_size_mb: float) -> ConversionResult:
         ext = image_path.suffix.lower()
 
         try:
             with Image.open(image_path) as raw_img:
-                img: Image.Image = ImageOps.exif_transpose(raw_img)
-                exif_rotated = img.size != raw_img.size
-                width, height = img.size
-                needs_resize = width > self.MAX_WIDTH or height > self.MAX_HEIGHT
+                # Pass-through is decided from the header (size, EXIF) alone; only
+                # the convert path below decodes pixels
+                exif_rotated = _header_orientation(raw_img) in _SWAPPED_ORIENTATIONS
+                # Decided on the full-size dimensions: a draft may already land on 4K
+                needs_resize = self._draft_to_target(raw_img, exif_rotated)
                 needs_compress = original_size_mb > self.max_size_mb
                 is_heic = ext == ".heic"
 
@@ -151,13 +234,14 @@ class ImageConverter:
                         converted_size_mb=None,
                     )
 
+                img: Image.Image = ImageOps.exif_transpose(raw_img)
                 if img.mode in ("RGBA", "P"):
                     img = img.convert("RGB")
 
                 if needs_resize:
                     img = self._resize_if_needed(img)
 
-                path_hash = hashlib.md5(str(image_path).encode()).hexdigest()[:8]
+                path_hash = _name_tag(image_path)
                 out_ext = "jpg" if is_heic else ext.lstrip(".")
                 if out_ext == "jpeg":
                     out_ext = "jpg"
@@ -201,33 +285,257 @@ class ImageConverter:
                 original_size_mb=original_size_mb,
             )
 
+    def _draft_to_target(self, raw_img: Image.Image, exif_rotated: bool) -> bool:
+        """Before decoding an oversized image, let the decoder pick a reduced scale.
+
+        JPEG decodes at the smallest 1/2, 1/4 or 1/8 DCT scale that still covers
+        the final 4K fit; HEIC decodes an embedded thumbnail instead of the full
+        image when one covers it. `_resize_if_needed` does the remaining LANCZOS
+        pass. No-op for formats without draft support (PNG).
+
+        Args:
+            raw_img: Lazily opened image, not yet loaded
+            exif_rotated: Whether EXIF transpose will swap width and height
+
+        Returns:
+            True if the (EXIF-oriented) image exceeds 4K and needs resizing
+        """
+        raw_w, raw_h = raw_img.size
+        if exif_rotated:
+            width, height = raw_h, raw_w
+        else:
+            width, height = raw_w, raw_h
+
+        ratio = min(self.MAX_WIDTH / width, self.MAX_HEIGHT / height)
+        if ratio >= 1:
+            return False
+        raw_img.draft(raw_img.mode, (math.ceil(raw_w * ratio), math.ceil(raw_h * ratio)))
+        return True
+
     def _resize_if_needed(self, img: Image.Image) -> Image.Image:
-        """Resize image if it exceeds 4K while maintaining aspect ratio."""
+        """Resize image (in place) if it exceeds 4K while maintaining aspect ratio.
+
+        `reducing_gap` first box-reduces by an integer factor, leaving LANCZOS
+        under 4x of the downscale instead of the full ratio (Pillow documents
+        2.0 as indistinguishable from a full LANCZOS pass in most cases).
+        """
         width, height = img.size
 
         if width <= self.MAX_WIDTH and height <= self.MAX_HEIGHT:
             return img
 
-        # Calculate aspect ratio preserving dimensions
-        ratio = min(self.MAX_WIDTH / width, self.MAX_HEIGHT / height)
-        new_width = int(width * ratio)
-        new_height = int(height * ratio)
-
-        self.logger.debug(f"Resizing from {width}×{height} to {new_width}×{new_height}")
-        return img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        img.thumbnail((self.MAX_WIDTH, self.MAX_HEIGHT), Image.Resampling.LANCZOS, reducing_gap=2.0)
+        self.logger.debug(f"Resized from {width}×{height} to {img.width}×{img.height}")
+        return img
 
     def _compress_to_limit(self, img: Image.Image, output_path: Path) -> bool:
-        """Save with decreasing quality until under max_size_mb."""
-        for quality in range(self.JPG_QUALITY, 69, -5):  # 95, 90, 85, 80, 75, 70
-            img.save(output_path, format="JPEG", quality=quality, optimize=True)
-            size_mb = output_path.stat().st_size / (1024 * 1024)
+        """Save as JPEG at a quality in 95, 90, ... 70 that fits under max_size_mb.
+
+        Most images fit at JPG_QUALITY on the first encode. Otherwise the overshoot
+        picks the next quality to try (file size roughly halves per 5 quality
+        steps), so a large overshoot skips rungs instead of encoding each one.
+        Encodes go to memory; only the one that fits is written to output_path.
+        """
+        max_bytes = self.max_size_mb * 1024 * 1024
+        quality = self.JPG_QUALITY
+        while True:
+            buf = io.BytesIO()
+            img.save(
+                buf,
+                format="JPEG",
+                quality=quality,
+                optimize=True,
+                progressive=self.PROGRESSIVE,
+            )
+            size_bytes = buf.tell()
 
-            if size_mb <= self.max_size_mb:
+            if size_bytes <= max_bytes:
+                output_path.write_bytes(buf.getbuffer())
                 if quality < self.JPG_QUALITY:
+                    size_mb = size_bytes / (1024 * 1024)
                     self.logger.debug(f"Compressed to quality {quality} ({size_mb:.2f}MB)")
                 return True
 
-        return False
+            if quality <= self.MIN_JPG_QUALITY:
+                return False
+            steps = max(1, math.ceil(math.log2(size_bytes / max_bytes)))
+            quality = max(quality - 5 * steps, self.MIN_JPG_QUALITY)
+
+
+def _header_orientation(raw_img: Image.Image) -> int:
+    """EXIF Orientation of a lazily opened image, without decoding pixel data."""
+    # Pillow's PNG getexif() loads the image to look for an eXIf chunk after
+    # IDAT; the spec puts eXIf before IDAT, so the header already has it
+    if raw_img.format == "PNG" and "exif" not in raw_img.info:
+        return 1
+    orientation: int = raw_img.getexif().get(ExifTags.Base.Orientation, 1)
+    return orientation
+
+
+# Per-process converter for ConversionPipeline workers (set by the pool initializer)
+_worker_converter: Optional[ImageConverter] = None
+
+
+def _heif_decode_threads(workers: int) -> Optional[int]:
+    """libheif decode threads per worker, or None to keep libheif's default.
+
+    libheif decodes HEIC grid tiles in parallel. Only when every worker running
+    the default thread count would oversubscribe the cores are they split.
+    """
+    cpus = os.cpu_count() or 1
+    if workers * pillow_heif.options.DECODE_THREADS <= cpus:
+        return None
+    return max(1, cpus // workers)
+
+
+def _init_convert_worker(
+    temp_dir: str, cache_dir: Optional[str], heif_decode_threads: Optional[int]
+) -> None:
+    """Pool initializer: leave SIGINT to the parent and build this worker's converter."""
+    global _worker_converter
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if heif_decode_threads is not None:
+        pillow_heif.options.DECODE_THREADS = heif_decode_threads
+    _worker_converter = ImageConverter(temp_dir, cache_dir)
+
+
+def _convert_in_worker(image_path: Path) -> ConversionResult:
+    assert _worker_converter is not None
+    return _worker_converter.convert_if_needed(image_path)
+
+
+class ConversionPipeline:
+    """Convert images on a process pool, a bounded window ahead of the uploader.
+
+    Results must be requested in submission order (as `upload_images` does);
+    each `result()` call tops the window back up to `2 * workers` conversions.
+    """
+
+    def __init__(
+        self,
+        temp_dir: str,
+        images: List[Path],
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        # A short batch needs no more workers than files, leaving libheif its threads
+        self.workers = workers or max(1, min(os.cpu_count() or 1, len(images)))
+        self._lookahead = 2 * self.workers
+        self._pending = iter(images)
+        self._futures: Dict[Path, Future[ConversionResult]] = {}
+        self._fallback = ImageConverter(temp_dir, cache_dir)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_convert_worker,
+            initargs=(temp_dir, cache_dir, _heif_decode_threads(self.workers)),
+        )
+        self._fill()
+
+    def __enter__(self) -> "ConversionPipeline":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _fill(self) -> None:
+        while len(self._futures) < self._lookahead:
+            image_path = next(self._pending, None)
+            if image_path is None:
+                return
+            self._futures[image_path] = self._pool.submit(_convert_in_worker, image_path)
+
+    def result(self, image_path: Path) -> ConversionResult:
+        """Wait for `image_path`'s conversion; convert inline if it was never queued
+        or its worker died."""
+        future = self._futures.pop(image_path, None)
+        self._fill()
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as e:
+                logger.warning(f"Worker failed converting {image_path.name}: {e}; retrying inline")
+        return self._fallback.convert_if_needed(image_path)
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _name_tag(image_path: Path) -> str:
+    """8-hex-digit tag keeping converted names apart (paths are unique, stems collide)."""
+    return hashlib.blake2b(os.fsencode(image_path), digest_size=4).hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst, copying when they're on different filesystems."""
+    try:
+        os.link(src, dst)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _temp_parent(cache_dir: Optional[str], needed_bytes: int) -> Optional[str]:
+    """Return /dev/shm for the upload temp dir if it is writable and has room.
+
+    Not used with a conversion cache: outputs are hard-linked to and from the
+    cache, and links cannot cross from tmpfs to disk, so they would become copies.
+    """
+    shm = "/dev/shm"
+    if cache_dir or not os.path.isdir(shm) or not os.access(shm, os.W_OK):
+        return None
+    try:
+        if shutil.disk_usage(shm).free < needed_bytes:
+            return None
+    except OSError:
+        return None
+    return shm
+
+
+def trim_conversion_cache(cache_dir: str, max_mb: int) -> None:
+    """Evict least recently used conversion cache entries until under max_mb."""
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+    except OSError as e:
+        logger.warning(f"Could not scan conversion cache {cache_dir}: {e}")
+        return
+
+    total = sum(size for _, size, _ in entries)
+    limit = max_mb * 1024 * 1024
+    evicted = 0
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        evicted += 1
+    if evicted:
+        logger.info(f"Evicted {evicted} conversion cache entries (limit {max_mb}MB)")
+
+
+def _scan_files(directory: str) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield file entries; DirEntry caches type and stat per entry.
+
+    Like Path.rglob, does not descend into symlinked directories but does
+    yield symlinked files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except OSError as e:
+        logger.warning(f"Could not scan {directory}: {e}")
 
 
 def discover_images(root_dir: str, min_size_mb: float = 1.0) -> List[Path]:
@@ -244,37 +552,34 @@ def discover_images(root_dir: str, min_size_mb: float = 1.0) -> List[Path]:
     if not root.is_dir():
         raise ValueError(f"Directory not found: {root_dir}")
 
-    valid_extensions = {".heic", ".jpg", ".jpeg", ".png"}
     min_size_bytes = min_size_mb * 1024 * 1024
     images = []
 
     logger.info(f"Scanning {root_dir} recursively (min size: {min_size_mb}MB)...")
 
-    for path in root.rglob("*"):
-        # Skip non-files
-        if not path.is_file():
-            continue
+    for entry in _scan_files(root_dir):
+        name = entry.name
+        name_lower = name.lower()
 
         # Check extension
-        ext = path.suffix.lower()
-        if ext not in valid_extensions:
+        if os.path.splitext(name_lower)[1] not in IMAGE_EXTENSIONS:
+            continue
+
+        # Check thumbnail patterns (regex only for names containing a token)
+        if any(t in name_lower for t in _THUMBNAIL_TOKENS) and THUMBNAIL_PATTERNS.search(name):
+            logger.debug(f"Skipping thumbnail: {name}")
             continue
 
         # Check file size
         try:
-            if path.stat().st_size < min_size_bytes:
-                logger.debug(f"Skipping small file: {path.name}")
+            if entry.stat().st_size < min_size_bytes:
+                logger.debug(f"Skipping small file: {name}")
                 continue
         except OSError as e:
-            logger.warning(f"Could not stat {path.name}: {e}")
-            continue
-
-        # Check thumbnail patterns
-        if THUMBNAIL_PATTERNS.search(path.name):
-            logger.debug(f"Skipping thumbnail: {path.name}")
+            logger.warning(f"Could not stat {name}: {e}")
             continue
 
-        images.append(path)
+        images.append(Path(entry.path))
 
     logger.info(f"Found {len(images)} valid images")
     return sorted(images)
@@ -312,7 +617,8 @@ def delete_all_art(client: SamsungFrameClient, force: bool = False) -> Dict[str,
 
     logger.info(f"Deleting {total} user-uploaded art items from TV...")
 
-    content_ids = [art.get("content_id") for art in user_art if art.get("content_id")]
+    content_ids: List[str] = [art["content_id"] for art in user_art]
+    client.discard_ready_art_list()
 
     # Try batch delete first
     try:
@@ -322,21 +628,55 @@ def delete_all_art(client: SamsungFrameClient, force: bool = False) -> Dict[str,
     except Exception as e:
         logger.warning(f"Batch delete failed: {e}. Falling back to individual deletes...")
 
-    # Fallback to individual deletes
+    deleted, failed = _delete_individually(client, content_ids)
+    logger.info(f"Deletion complete: {deleted} deleted, {failed} failed")
+    return {"total": total, "deleted": deleted, "failed": failed}
+
+
+def _delete_individually(client: SamsungFrameClient, content_ids: List[str]) -> Tuple[int, int]:
+    """Delete items one at a time with retry, reconnecting if the TV drops.
+
+    Serial on purpose: each art() call opens its own websocket, and this runs
+    right after the TV already failed a batch delete.
+
+    Returns:
+        (deleted, failed) counts; items left after a failed reconnect count as failed
+    """
+    total = len(content_ids)
     deleted = 0
     failed = 0
 
-    for content_id in content_ids:
+    @retry(
+        stop=stop_after_attempt(2),
+        wait=wait_exponential(multiplier=1, min=1, max=5),
+        reraise=True,
+    )
+    def delete_single(cid: str) -> None:
+        assert client.tv is not None
+        client.tv.art().delete(cid)
+
+    for i, content_id in enumerate(content_ids):
         try:
-            client.tv.art().delete(content_id)
+            delete_single(content_id)
             deleted += 1
-            logger.info(f"Deleted {content_id} ({deleted}/{len(content_ids)})")
+            logger.debug(f"Deleted {content_id} ({deleted}/{total})")
+            continue
         except Exception as e:
-            logger.error(f"Failed to delete {content_id}: {e}")
+            logger.error(f"Failed to delete {content_id} after retries: {e}")
             failed += 1
 
-    logger.info(f"Deletion complete: {deleted} deleted, {failed} failed")
-    return {"total": total, "deleted": deleted, "failed": failed}
+        try:
+            client.ping()
+        except Exception:
+            logger.warning("TV connection lost during deletes, reconnecting...")
+            client.close()
+            if not client.connect_ready():
+                remaining = total - i - 1
+                logger.error(f"Cannot reconnect — {remaining} deletes not attempted")
+                failed += remaining
+                break
+
+    return deleted, failed
 
 
 def delete_art_by_ids(client: SamsungFrameClient, content_ids: List[str]) -> Dict[str, int]:
@@ -357,6 +697,7 @@ def delete_art_by_ids(client: SamsungFrameClient, content_ids: List[str]) -> Dic
         return {"total": 0, "deleted": 0, "failed": 0}
 
     logger.info(f"Deleting {total} art items...")
+    client.discard_ready_art_list()
 
     # Try batch delete first with retry
     @retry(
@@ -375,29 +716,7 @@ def delete_art_by_ids(client: SamsungFrameClient, content_ids: List[str]) -> Dic
     except Exception as e:
         logger.warning(f"Batch delete failed after retries: {e}. Falling back to individual...")
 
-    # Fallback to individual deletes with retry
-    deleted = 0
-    failed = 0
-
-    for content_id in content_ids:
-
-        @retry(
-            stop=stop_after_attempt(2),
-            wait=wait_exponential(multiplier=1, min=1, max=5),
-            reraise=True,
-        )
-        def delete_single(cid: str) -> None:
-            assert client.tv is not None
-            client.tv.art().delete(cid)
-
-        try:
-            delete_single(content_id)
-            deleted += 1
-            logger.debug(f"Deleted {content_id} ({deleted}/{total})")
-        except Exception as e:
-            logger.error(f"Failed to delete {content_id} after retries: {e}")
-            failed += 1
-
+    deleted, failed = _delete_individually(client, content_ids)
     logger.info(f"Individual deletion complete: {deleted} deleted, {failed} failed")
     return {"total": total, "deleted": deleted, "failed": failed}
 
@@ -427,8 +746,90 @@ def calculate_images_to_delete(
     if delete_count >= len(existing_ids):
         return existing_ids  # Delete all old images
 
-    # Randomly select which old images to delete
-    return random.sample(existing_ids, delete_count)
+    # Randomly select which old images to delete, by index (no string hashing).
+    # When deleting most of them, sampling the smaller set to keep is cheaper.
+    indices = range(len(existing_ids))
+    if delete_count * 2 > len(existing_ids):
+        keep = set(random.sample(indices, len(existing_ids) - delete_count))
+        return [cid for i, cid in enumerate(existing_ids) if i not in keep]
+    return [existing_ids[i] for i in random.sample(indices, delete_count)]
+
+
+UPLOAD_HASH_CHUNK = 64 * 1024
+
+
+def content_hash(image_path: Path) -> str:
+    """Return a 64-bit fingerprint of the file's size and its first and last 64 KB."""
+    size = image_path.stat().st_size
+    h = hashlib.blake2b(size.to_bytes(8, "little"), digest_size=8)
+    with open(image_path, "rb") as f:
+        h.update(f.read(UPLOAD_HASH_CHUNK))
+        if size > UPLOAD_HASH_CHUNK:
+            f.seek(max(size - UPLOAD_HASH_CHUNK, UPLOAD_HASH_CHUNK))
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def load_upload_index(index_file: str) -> Dict[str, str]:
+    """Load the content hash -> content_id map written by a previous run."""
+    try:
+        with open(index_file) as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable upload index {index_file}: {e}")
+        return {}
+    return {str(k): str(v) for k, v in index.items()} if isinstance(index, dict) else {}
+
+
+def save_upload_index(index_file: str, index: Dict[str, str]) -> None:
+    """Atomically write the content hash -> content_id map."""
+    path = Path(index_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(index, indent=1, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def prune_upload_index(
+    index: Dict[str, str], art_list: List[Dict[str, Any]]
+) -> Optional[Dict[str, str]]:
+    """Keep only index entries whose content_id is still on the TV.
+
+    Returns:
+        The pruned index, or None for an empty art_list: get_available_art()
+        also returns [] when listing fails, and pruning against that would
+        erase every entry
+    """
+    if not art_list:
+        return None
+    on_tv = {a.get("content_id", "") for a in art_list}
+    return {h: cid for h, cid in index.items() if cid in on_tv}
+
+
+def filter_already_uploaded(
+    images: List[Path], hashes: Dict[str, str], index: Dict[str, str]
+) -> tuple[List[Path], Dict[str, str]]:
+    """Drop images whose content already backs art on the TV.
+
+    Args:
+        images: Candidate source images
+        hashes: `content_hash` per source path (images missing here are kept)
+        index: content hash -> content_id, already pruned to IDs still on the TV
+
+    Returns:
+        (images still to upload, index entries backing the skipped images)
+    """
+    remaining: List[Path] = []
+    live: Dict[str, str] = {}
+    for p in images:
+        h = hashes.get(str(p))
+        if h is not None and h in index:
+            live[h] = index[h]
+        else:
+            remaining.append(p)
+    return remaining, live
 
 
 def get_stale_art_ids(art_list: List[Dict[str, Any]], max_age_hours: int = 24) -> List[str]:
@@ -515,6 +916,35 @@ def run_batch_upload(args: argparse.Namespace) -> int:
         logger.error("No images remaining after start-index/max-files filtering")
         return 1
 
+    # Skip photos a previous run already put on the TV (matched by content, not name)
+    index_file = cfg.samsung_frame.upload_index_file
+    upload_index: Dict[str, str] = {}
+    on_tv_index: Dict[str, str] = {}
+    hashes: Dict[str, str] = {}
+    live_index: Dict[str, str] = {}
+    if index_file:
+        upload_index = load_upload_index(index_file)
+        if upload_index:
+            try:
+                art_list = client.get_available_art()
+            except Exception as e:
+                logger.warning(f"Could not list art on TV: {e}")
+                art_list = []
+            pruned = prune_upload_index(upload_index, art_list)
+            if pruned is None:
+                # Kept for the next run; without a listing nothing is known to be on the TV
+                logger.warning("No art listed on TV, uploading everything")
+            else:
+                upload_index = on_tv_index = pruned
+        for p in images:
+            try:
+                hashes[str(p)] = content_hash(p)
+            except OSError as e:
+                logger.debug(f"Could not hash {p.name}: {e}")
+        images, live_index = filter_already_uploaded(images, hashes, on_tv_index)
+        if live_index:
+            logger.info(f"Skipping {len(live_index)} images already on TV")
+
     art_deleted = 0
     art_delete_failures = 0
     total_art_on_tv = 0
@@ -543,19 +973,22 @@ def run_batch_upload(args: argparse.Namespace) -> int:
             )
         images = landscape_images
 
-    if not images:
+    if not images and not live_index:
         logger.error("No images remaining after portrait filtering")
         return 1
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        converter = ImageConverter(temp_dir)
+    cache_dir = cfg.samsung_frame.conversion_cache_dir or None
+    # Converted files are written once and read once by the upload; keep them in RAM
+    # where possible (worst case every image is converted at the size limit)
+    needed_bytes = len(images) * cfg.samsung_frame.max_image_size_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory(dir=_temp_parent(cache_dir, needed_bytes)) as temp_dir:
         seen: set[str] = set()
 
         def prepare_one(source_path: str) -> Optional[str]:
-            """Convert/resize one image into temp dir, return upload-ready path."""
+            """Collect one image's conversion from the pipeline, return upload-ready path."""
             nonlocal heic_converted
             image_path = Path(source_path)
-            result = converter.convert_if_needed(image_path)
+            result = pipeline.result(image_path)
 
             if not result.success:
                 conversion_errors.append(
@@ -576,12 +1009,29 @@ def run_batch_upload(args: argparse.Namespace) -> int:
 
             trimmed = trim_filename(image_path.name, seen=seen)
             final_path = Path(temp_dir) / trimmed
-            shutil.copy2(image_path, final_path)
+            # Upload-ready as-is: link rather than copy, so the upload's read is the
+            # only full read of the file (and hits pages the converter just read)
+            try:
+                final_path.symlink_to(image_path.resolve())
+            except OSError:
+                shutil.copy2(image_path, final_path)
             return str(final_path)
 
         matte = args.matte
         image_paths = [str(p) for p in images]
-        upload_summary = client.upload_images(image_paths, matte=matte, prepare_fn=prepare_one)
+        # Conversions run on a process pool ahead of the (serial) TV uploads
+        with ConversionPipeline(temp_dir, images, cache_dir=cache_dir) as pipeline:
+            upload_summary = client.upload_images(image_paths, matte=matte, prepare_fn=prepare_one)
+        if cache_dir:
+            trim_conversion_cache(cache_dir, cfg.samsung_frame.conversion_cache_max_mb)
+        if index_file:
+            for source, content_id in upload_summary.uploaded_sources.items():
+                if source in hashes:
+                    upload_index[hashes[source]] = content_id
+            try:
+                save_upload_index(index_file, upload_index)
+            except OSError as e:
+                logger.warning(f"Could not save upload index {index_file}: {e}")
         completed = upload_summary.successful_uploads + upload_summary.failed_uploads
         interrupted = completed < upload_summary.total_images
 
@@ -596,10 +1046,13 @@ def run_batch_upload(args: argparse.Namespace) -> int:
             art_deleted=0,
             art_delete_failures=0,
             total_art_on_tv=0,
+            already_on_tv=len(live_index),
             upload_summary=upload_summary,
             conversion_errors=conversion_errors,
         )
 
+        # User art count from the purge's post-upload listing, if it ran
+        listed_user_art: Optional[int] = None
         try:
             # --- Purge: delete stale art using image_date from TV API ---
             # Purge runs even if uploads were partially aborted
@@ -617,7 +1070,11 @@ def run_batch_upload(args: argparse.Namespace) -> int:
                 if purge_ready:
                     art_list = client.get_available_art()
                     user_art = [a for a in art_list if a.get("content_id", "").startswith("MY_F")]
-                    stale_ids = get_stale_art_ids(art_list)
+                    if art_list:  # empty also means the listing failed
+                        listed_user_art = len(user_art)
+                    # Art still backing a current source file is kept, not cycled
+                    in_use = set(live_index.values())
+                    stale_ids = [c for c in get_stale_art_ids(art_list) if c not in in_use]
 
                     min_images = cfg.samsung_frame.min_images
                     remaining = len(user_art) - len(stale_ids)
@@ -641,14 +1098,17 @@ def run_batch_upload(args: argparse.Namespace) -> int:
                         logger.info("No stale art to purge")
 
             # --- Get current art count on TV ---
-            try:
-                client.ping()
-                art_list = client.get_available_art()
-                total_art_on_tv = sum(
-                    1 for a in art_list if a.get("content_id", "").startswith("MY_F")
-                )
-            except Exception:
-                pass
+            if listed_user_art is not None:
+                total_art_on_tv = listed_user_art - art_deleted
+            else:
+                try:
+                    client.ping()
+                    art_list = client.get_available_art()
+                    total_art_on_tv = sum(
+                        1 for a in art_list if a.get("content_id", "").startswith("MY_F")
+                    )
+                except Exception:
+                    pass
         except (KeyboardInterrupt, SystemExit):
             interrupted = True
 
@@ -662,6 +1122,7 @@ def run_batch_upload(args: argparse.Namespace) -> int:
             art_deleted=art_deleted,
             art_delete_failures=art_delete_failures,
             total_art_on_tv=total_art_on_tv,
+            already_on_tv=len(live_index),
             upload_summary=upload_summary,
             conversion_errors=conversion_errors,
         )
@@ -673,6 +1134,7 @@ def run_batch_upload(args: argparse.Namespace) -> int:
         logger.info("=" * 50)
         logger.info("BATCH UPLOAD SUMMARY")
         logger.info(f"Discovered: {summary.total_discovered}")
+        logger.info(f"Already on TV: {summary.already_on_tv}")
         logger.info(f"Portraits skipped: {summary.portraits_skipped}")
         logger.info(f"Converted: {summary.heic_converted} HEIC files")
         logger.info(f"Deleted: {summary.art_deleted} existing art")
@@ -715,7 +1177,7 @@ def run_batch_upload(args: argparse.Namespace) -> int:
         if client:
             client.close()
 
-        return 0 if summary.upload_summary.successful_uploads > 0 else 1
+        return 0 if summary.upload_summary.successful_uploads or summary.already_on_tv else 1
 
 
 def send_batch_notification(summary: BatchUploadSummary, interrupted: bool = False) -> None:
@@ -737,6 +1199,7 @@ def send_batch_notification(summary: BatchUploadSummary, interrupted: bool = Fal
 
     message = (
         f"✅ Uploaded: {summary.upload_summary.successful_uploads}\n"
+        f"⏭ Already on TV: {summary.already_on_tv}\n"
         f"❌ Failed: {total_failures}\n"
         f"🗑 Deleted: {summary.art_deleted} stale\n"
         f"🖼 Total on TV: {summary.total_art_on_tv}"
@@ -3,22 +3,19 @@
 
 import argparse
 import sys
+from typing import TYPE_CHECKING, Callable, Dict
 
-from SamsungFrame.samsung_client import SamsungFrameClient
-from lib.MyPushover import Pushover
 from lib.logger import get_logger
 from lib.config import get_config
 
+if TYPE_CHECKING:
+    from SamsungFrame.samsung_client import SamsungFrameClient
+
 cfg = get_config()
-pushover = Pushover(
-    cfg.pushover.user,
-    cfg.pushover.tokens.get("SamsungFrame", cfg.pushover.default_token),
-)
 
 
 def main() -> int:
     """Main entry point with command line interface."""
-    cfg = get_config()
     logger = get_logger(__name__)
     logger.info("=" * 50)
     logger.info("Starting Samsung Frame TV Art Manager")
@@ -108,36 +105,26 @@ def main() -> int:
         parser.print_help()
         return 1
 
-    # Route to appropriate handler
-    if args.command == "status":
-        return show_status(args)
-    elif args.command == "list-art":
-        return list_art(args)
-    elif args.command == "list-mattes":
-        return list_mattes(args)
-    elif args.command == "download-thumbnails":
-        return download_thumbnails(args)
-    elif args.command == "update-mattes":
-        return update_mattes(args)
-    elif args.command == "cycle-images":
-        return cycle_images(args)
-    elif args.command == "start-slideshow":
-        return start_slideshow(args)
-    elif args.command == "reboot":
-        return reboot_tv(args)
-    elif args.command == "delete-all":
-        return delete_all(args)
-    elif args.command == "purge":
-        return purge_art(args)
-
-    return 0
+    # argparse already rejected unknown commands
+    return _COMMANDS[args.command](args)
+
+
+def _client() -> "SamsungFrameClient":
+    """Build a TV client, importing it only once a command actually runs.
+
+    samsungtvws, Pillow and friends take ~0.25s to load, which --help and
+    argument errors shouldn't pay.
+    """
+    from SamsungFrame.samsung_client import SamsungFrameClient
+
+    return SamsungFrameClient()
 
 
 def show_status(_args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             logger.info("=" * 50)
             logger.info("TV STATUS")
             logger.info("=" * 50)
@@ -178,7 +165,7 @@ def list_art(_args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             logger.info("Retrieving available art...")
             art_list = client.get_available_art()
 
@@ -202,7 +189,7 @@ def list_mattes(_args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             logger.info("Retrieving available matte styles...")
             mattes = client.get_available_mattes()
 
@@ -225,7 +212,7 @@ def download_thumbnails(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             user_photos_only = not args.all
             if user_photos_only:
                 logger.info("Downloading thumbnails for user-uploaded photos only...")
@@ -250,7 +237,7 @@ def update_mattes(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             matte = args.matte
             user_photos_only = not args.include_preinstalled
 
@@ -278,7 +265,7 @@ def cycle_images(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             user_photos_only = not args.all
             shuffle = not args.no_shuffle
             client.cycle_images(
@@ -298,7 +285,7 @@ def start_slideshow(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             shuffle = not args.no_shuffle
             if client.start_slideshow(duration=args.duration, shuffle=shuffle):
                 logger.info("Slideshow started successfully")
@@ -316,7 +303,7 @@ def delete_all(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             from SamsungFrame.batch_upload import delete_all_art
 
             result = delete_all_art(client, force=args.force)
@@ -337,7 +324,7 @@ def purge_art(args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             from SamsungFrame.batch_upload import delete_art_by_ids, get_stale_art_ids
 
             art_list = client.get_available_art()
@@ -383,7 +370,7 @@ def reboot_tv(_args: argparse.Namespace) -> int:
     logger = get_logger(__name__)
 
     try:
-        with SamsungFrameClient() as client:
+        with _client() as client:
             if client._reboot_and_reconnect():
                 logger.info("TV rebooted and in art mode")
                 return 0
@@ -396,5 +383,19 @@ def reboot_tv(_args: argparse.Namespace) -> int:
         return 1
 
 
+_COMMANDS: Dict[str, Callable[[argparse.Namespace], int]] = {
+    "status": show_status,
+    "list-art": list_art,
+    "list-mattes": list_mattes,
+    "download-thumbnails": download_thumbnails,
+    "update-mattes": update_mattes,
+    "cycle-images": cycle_images,
+    "start-slideshow": start_slideshow,
+    "reboot": reboot_tv,
+    "delete-all": delete_all,
+    "purge": purge_art,
+}
+
+
 if __name__ == "__main__":
     sys.exit(main())
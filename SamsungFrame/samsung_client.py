@@ -3,6 +3,7 @@
 import os
 import signal
 import socket
+import sys
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, cast
@@ -58,6 +59,7 @@ class ImageUploadSummary(BaseModel):
     failed_uploads: int
     uploaded_image_ids: List[str]
     errors: List[Dict[str, str]]
+    uploaded_sources: Dict[str, str] = {}  # source path -> content_id
 
 
 class SamsungFrameClient:
@@ -79,6 +81,10 @@ class SamsungFrameClient:
             raise ValueError("Samsung Frame TV IP address required")
 
         self.tv: Optional[SamsungTVWS] = None
+        # Art list fetched by ensure_art_mode's readiness probe, handed to the
+        # next get_available_art() once; dropped whenever art is uploaded or
+        # deleted (see discard_ready_art_list) and on close
+        self._ready_art_list: Optional[List[Dict[str, Any]]] = None
         self.logger = get_logger(__name__)
         self.logger.info(f"Samsung Frame client initialized for {self.host}:{self.port}")
 
@@ -341,6 +347,7 @@ class SamsungFrameClient:
         if not self.validate_image_file(image_path):
             return None
 
+        self.discard_ready_art_list()  # the art list is about to change
         try:
             with open(image_path, "rb") as f:
                 image_data = f.read()
@@ -410,6 +417,7 @@ class SamsungFrameClient:
             )
 
         uploaded_ids: List[str] = []
+        uploaded_sources: Dict[str, str] = {}
         errors: List[Dict[str, str]] = []
         consecutive_failures = 0
         rebooted = False
@@ -418,7 +426,14 @@ class SamsungFrameClient:
         min_pause = 5
         max_pause = 30
 
-        pbar = tqdm(image_files, desc="Uploading images", unit="img")
+        # Bar only on a terminal; under cron it would just spam the log
+        pbar = tqdm(
+            image_files,
+            desc="Uploading images",
+            unit="img",
+            mininterval=1.0,
+            disable=not sys.stderr.isatty(),
+        )
         try:
             for image_path in pbar:
                 pbar.set_postfix_str(os.path.basename(image_path))
@@ -437,6 +452,7 @@ class SamsungFrameClient:
                     image_id = self.upload_image(upload_path, matte=matte)
                     if image_id:
                         uploaded_ids.append(image_id)
+                        uploaded_sources[image_path] = image_id
                         known_ids.add(image_id)
                         consecutive_failures = 0
                         self.logger.debug(f"Uploaded {os.path.basename(image_path)} -> {image_id}")
@@ -444,6 +460,7 @@ class SamsungFrameClient:
                         new_id = self._check_for_new_upload(known_ids)
                         if new_id:
                             uploaded_ids.append(new_id)
+                            uploaded_sources[image_path] = new_id
                             known_ids.add(new_id)
                             consecutive_failures = 0
                             self.logger.debug(
@@ -463,6 +480,7 @@ class SamsungFrameClient:
                     new_id = self._check_for_new_upload(known_ids)
                     if new_id:
                         uploaded_ids.append(new_id)
+                        uploaded_sources[image_path] = new_id
                         known_ids.add(new_id)
                         consecutive_failures = 0
                         self.logger.debug(
@@ -514,6 +532,7 @@ class SamsungFrameClient:
             failed_uploads=len(errors),
             uploaded_image_ids=uploaded_ids,
             errors=errors,
+            uploaded_sources=uploaded_sources,
         )
 
         self.logger.info(
@@ -562,7 +581,7 @@ class SamsungFrameClient:
 
         # Already in art mode?
         try:
-            self.get_available_art_strict()
+            self._ready_art_list = self.get_available_art_strict()
             self.logger.debug("Art mode confirmed, API responding")
             return True
         except Exception:
@@ -584,7 +603,7 @@ class SamsungFrameClient:
             time.sleep(wait)
             try:
                 if self._wake_and_connect():
-                    self.get_available_art_strict()
+                    self._ready_art_list = self.get_available_art_strict()
                     self.logger.info("Art mode activated via KEY_POWER toggle")
                     return True
             except Exception:
@@ -682,10 +701,18 @@ class SamsungFrameClient:
         self.logger.debug(f"Retrieved {user_count} user uploaded images from TV")
         return art_list
 
+    def discard_ready_art_list(self) -> None:
+        """Forget the readiness probe's art list; call before changing the TV's art."""
+        self._ready_art_list = None
+
     def get_available_art(self) -> List[Dict[str, Any]]:
         if not self.tv:
             raise RuntimeError("Not connected to TV - call connect() first")
 
+        if self._ready_art_list is not None:
+            art_list, self._ready_art_list = self._ready_art_list, None
+            return art_list
+
         try:
             art_list = self._fetch_art_list()
             user_count = sum(1 for a in art_list if a.get("content_id", "").startswith("MY_F"))
@@ -752,7 +779,13 @@ class SamsungFrameClient:
         skipped = 0
         failed = 0
 
-        for art_item in tqdm(art_list, desc="Updating mattes", unit="art"):
+        for art_item in tqdm(
+            art_list,
+            desc="Updating mattes",
+            unit="art",
+            mininterval=1.0,
+            disable=not sys.stderr.isatty(),
+        ):
             content_id = art_item.get("content_id")
             current_matte = art_item.get("matte_id")
 
@@ -893,6 +926,7 @@ class SamsungFrameClient:
 
         try:
             cycle_count = 0
+            next_change = time.monotonic()
             while True:
                 # Shuffle list at start of each cycle if enabled
                 if shuffle:
@@ -906,10 +940,13 @@ class SamsungFrameClient:
                     try:
                         self.tv.art().select_image(content_id)
                         self.logger.info(f"Displaying: {content_id}")
-                        time.sleep(period)
                     except Exception as e:
                         self.logger.error(f"Failed to display {content_id}: {e}")
-                        continue
+
+                    # Fixed-rate schedule: select_image latency doesn't stretch the period,
+                    # and failures still wait instead of spinning through the list
+                    next_change = max(next_change + period, time.monotonic())
+                    time.sleep(max(0.0, next_change - time.monotonic()))
 
                 cycle_count += 1
                 self.logger.info(f"Completed cycle {cycle_count}")
@@ -937,6 +974,8 @@ class SamsungFrameClient:
         downloaded = 0
         failed = 0
 
+        # Serial on purpose: each art() call opens its own websocket, and the art
+        # service falls over under concurrent or back-to-back requests
         for art_item in art_list:
             content_id = art_item.get("content_id")
             if not content_id:
@@ -957,6 +996,13 @@ class SamsungFrameClient:
             except Exception as e:
                 self.logger.error(f"Failed to download thumbnail for {content_id}: {e}")
                 failed += 1
+                try:
+                    self.ping()
+                except Exception:
+                    self.logger.warning("Connection lost, reconnecting...")
+                    if not self._reconnect():
+                        self.logger.error("Reconnect failed — stopping thumbnail downloads")
+                        break
 
         self.logger.info(f"Thumbnail download complete: {downloaded} downloaded, {failed} failed")
         return {"total": len(art_list), "downloaded": downloaded, "failed": failed}
@@ -983,6 +1029,7 @@ class SamsungFrameClient:
 
     def close(self) -> None:
         """Close connection to TV."""
+        self._ready_art_list = None
         if self.tv:
             try:
                 self.tv.close()
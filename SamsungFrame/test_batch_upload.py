@@ -1,18 +1,31 @@
 """Tests for Samsung Frame TV batch upload."""
 
+import os
 import tempfile
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from unittest.mock import Mock, patch
 import pytest
-from PIL import Image
+from PIL import Image, ImageFile
 
 from SamsungFrame.batch_upload import (
+    ConversionPipeline,
+    ConversionResult,
     ImageConverter,
+    calculate_images_to_delete,
+    content_hash,
     discover_images,
     delete_all_art,
+    delete_art_by_ids,
+    filter_already_uploaded,
+    load_upload_index,
+    prune_upload_index,
+    save_upload_index,
     trim_filename,
     get_stale_art_ids,
+    trim_conversion_cache,
+    _heif_decode_threads,
+    _temp_parent,
 )
 from SamsungFrame.samsung_client import SamsungFrameClient
 
@@ -130,6 +143,17 @@ class TestImageDiscovery:
             images = discover_images(tmp_dir, min_size_mb=0.0)
             assert len(images) == 3
 
+    def test_discover_symlinks(self) -> None:
+        """Symlinked files are found; symlinked directories are not descended."""
+        with tempfile.TemporaryDirectory() as tmp_dir, tempfile.TemporaryDirectory() as other:
+            root = Path(tmp_dir)
+            Image.new("RGB", (100, 100)).save(Path(other) / "outside.jpg", format="JPEG")
+            (root / "linked.jpg").symlink_to(Path(other) / "outside.jpg")
+            (root / "linked_dir").symlink_to(other, target_is_directory=True)
+
+            images = discover_images(tmp_dir, min_size_mb=0.0)
+            assert [img.name for img in images] == ["linked.jpg"]
+
 
 class TestImageConverter:
     """Test HEIC conversion and resizing."""
@@ -149,6 +173,35 @@ class TestImageConverter:
             assert result.converted_path is None
             assert result.source_path == str(jpg_path)
 
+    def test_jpg_passthrough_reads_header_only(self) -> None:
+        """An upload-ready JPG is passed through without decoding pixel data."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jpg_path = Path(tmp_dir) / "test.jpg"
+            Image.new("RGB", (500, 500), color="yellow").save(jpg_path, format="JPEG")
+
+            converter = ImageConverter(tmp_dir)
+            with patch.object(ImageFile.ImageFile, "load", autospec=True) as load:
+                result = converter.convert_if_needed(jpg_path)
+
+            assert result.success
+            assert result.converted_path is None
+            load.assert_not_called()
+
+    def test_exif_rotated_jpg_is_converted(self) -> None:
+        """A JPG whose EXIF orientation swaps width/height is transposed, not passed through."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jpg_path = Path(tmp_dir) / "rotated.jpg"
+            exif = Image.Exif()
+            exif[0x0112] = 6  # Orientation: rotate 90 CW
+            Image.new("RGB", (400, 300), color="yellow").save(jpg_path, format="JPEG", exif=exif)
+
+            result = ImageConverter(tmp_dir).convert_if_needed(jpg_path)
+
+            assert result.success
+            assert result.converted_path is not None
+            with Image.open(result.converted_path) as converted:
+                assert converted.size == (300, 400)
+
     def test_png_passthrough(self) -> None:
         """Test PNG files pass through unchanged (same as JPG)."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -163,6 +216,20 @@ class TestImageConverter:
             assert result.converted_path is None
             assert result.source_path == str(png_path)
 
+    def test_png_passthrough_reads_header_only(self) -> None:
+        """An in-spec PNG is passed through without decoding pixel data."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            png_path = Path(tmp_dir) / "test.png"
+            Image.new("RGB", (500, 500), color="cyan").save(png_path, format="PNG")
+
+            converter = ImageConverter(tmp_dir)
+            with patch.object(ImageFile.ImageFile, "load", autospec=True) as load:
+                result = converter.convert_if_needed(png_path)
+
+            assert result.success
+            assert result.converted_path is None
+            load.assert_not_called()
+
     def test_resize_large_image(self) -> None:
         """Test resizing image larger than 4K."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -193,6 +260,48 @@ class TestImageConverter:
             ratio = resized.width / resized.height
             assert abs(ratio - (16 / 9)) < 0.01
 
+    def test_large_heic_decodes_covering_thumbnail(self) -> None:
+        """An oversized HEIC with an embedded thumbnail covering the target fit
+        decodes that instead of the full image (small target keeps encode fast)."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            img_path = Path(tmp_dir) / "huge.heic"
+            Image.new("RGB", (1200, 675), color="teal").save(
+                img_path, format="HEIF", quality=50, thumbnails=[700]
+            )
+
+            converter = ImageConverter(tmp_dir)
+            converter.MAX_WIDTH, converter.MAX_HEIGHT = 640, 360
+            with Image.open(img_path) as raw_img:
+                assert converter._draft_to_target(raw_img, exif_rotated=False)
+                assert raw_img.width == 700
+
+            result = converter.convert_if_needed(img_path)
+
+            assert result.success
+            assert result.converted_path is not None
+            with Image.open(result.converted_path) as converted:
+                assert converted.width == 640
+
+    @pytest.mark.parametrize(
+        "size, expected",
+        [((8000, 6000), (2880, 2160)), ((7680, 4320), (3840, 2160))],
+    )
+    def test_large_jpeg_draft_decode(
+        self, size: tuple[int, int], expected: tuple[int, int]
+    ) -> None:
+        """Oversized JPEGs decode at a reduced scale and still end at the 4K fit,
+        including when the draft scale alone lands exactly on 4K."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            img_path = Path(tmp_dir) / "huge.jpg"
+            Image.new("RGB", size, color="orange").save(img_path, format="JPEG")
+
+            result = ImageConverter(tmp_dir).convert_if_needed(img_path)
+
+            assert result.success
+            assert result.converted_path is not None
+            with Image.open(result.converted_path) as converted:
+                assert converted.size == expected
+
     def test_compress_to_limit(self) -> None:
         """Test compression reduces file size."""
         with tempfile.TemporaryDirectory() as tmp_dir:
@@ -207,6 +316,26 @@ class TestImageConverter:
             assert output_path.exists()
             size_mb = output_path.stat().st_size / (1024 * 1024)
             assert size_mb <= 10.0
+            with Image.open(output_path) as saved:
+                assert saved.info.get("progressive")
+
+    def test_compress_to_limit_skips_rungs_on_large_overshoot(self) -> None:
+        """A big overshoot at quality 95 jumps straight down the ladder and
+        still gives up at 70 if nothing fits."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            noise = Image.frombytes("RGB", (1024, 1024), os.urandom(1024 * 1024 * 3))
+            output_path = Path(tmp_dir) / "noise.jpg"
+
+            converter = ImageConverter(tmp_dir)
+            converter.max_size_mb = 0.01  # far below any achievable size
+            with patch.object(noise, "save", wraps=noise.save) as save:
+                assert not converter._compress_to_limit(noise, output_path)
+
+            qualities = [c.kwargs["quality"] for c in save.call_args_list]
+            assert qualities[0] == 95
+            assert qualities[-1] == 70
+            assert len(qualities) < 6  # fewer encodes than the 95..70 ladder
+            assert not output_path.exists()  # rejected encodes never hit disk
 
     def test_invalid_image_handling(self) -> None:
         """Test handling of invalid image files."""
@@ -222,6 +351,121 @@ class TestImageConverter:
             assert result.error_message is not None
 
 
+class TestConversionCache:
+    """Test reuse of converted images across runs."""
+
+    def _convert(self, root: Path, source: Path, run: str) -> ConversionResult:
+        temp_dir = root / run
+        temp_dir.mkdir()
+        return ImageConverter(str(temp_dir), str(root / "cache")).convert_if_needed(source)
+
+    def test_unchanged_source_reuses_cached_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            source = root / "large.jpg"
+            Image.new("RGB", (5000, 4000), color="orange").save(source, format="JPEG")
+            first = self._convert(root, source, "run1")
+
+            with patch.object(ImageConverter, "_convert") as convert:
+                second = self._convert(root, source, "run2")
+
+            convert.assert_not_called()
+            assert second.success
+            assert second.converted_path is not None
+            assert Path(second.converted_path).parent == root / "run2"
+            assert first.converted_size_mb == second.converted_size_mb
+
+    def test_modified_source_is_reconverted(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            source = root / "large.jpg"
+            Image.new("RGB", (5000, 4000), color="orange").save(source, format="JPEG")
+            self._convert(root, source, "run1")
+            os.utime(source, ns=(0, 0))
+
+            with patch.object(ImageConverter, "_convert") as convert:
+                convert.return_value = ConversionResult(
+                    source_path=str(source), success=False, original_size_mb=1.0
+                )
+                self._convert(root, source, "run2")
+
+            convert.assert_called_once()
+
+    def test_trim_evicts_least_recently_used(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for i in range(3):
+                entry = Path(cache_dir) / f"entry{i}.jpg"
+                entry.write_bytes(b"x" * 1024 * 1024)
+                os.utime(entry, (1000 + i, 1000 + i))
+
+            trim_conversion_cache(cache_dir, max_mb=2)
+
+            assert sorted(p.name for p in Path(cache_dir).iterdir()) == [
+                "entry1.jpg",
+                "entry2.jpg",
+            ]
+
+
+class TestTempParent:
+    """Test choosing tmpfs for the upload temp dir."""
+
+    def test_skipped_with_conversion_cache(self) -> None:
+        assert _temp_parent("/some/cache", 0) is None
+
+    def test_skipped_when_too_small(self) -> None:
+        assert _temp_parent(None, 2**62) is None
+
+    @pytest.mark.skipif(not os.access("/dev/shm", os.W_OK), reason="no writable /dev/shm")
+    def test_uses_shm_when_it_fits(self) -> None:
+        assert _temp_parent(None, 0) == "/dev/shm"
+
+
+class TestConversionPipeline:
+    """Test process-pool conversion ahead of the uploader."""
+
+    @pytest.mark.parametrize("workers, expected", [(1, None), (2, None), (4, 2), (8, 1), (16, 1)])
+    def test_heif_decode_threads_split_only_when_oversubscribed(
+        self, workers: int, expected: int | None
+    ) -> None:
+        """With 8 cores and libheif's default of 4 threads, only >2 workers split."""
+        with (
+            patch("os.cpu_count", return_value=8),
+            patch("pillow_heif.options.DECODE_THREADS", 4),
+        ):
+            assert _heif_decode_threads(workers) == expected
+
+    def test_results_match_inline_conversion(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src = Path(tmp_dir) / "src"
+            out = Path(tmp_dir) / "out"
+            src.mkdir()
+            out.mkdir()
+            small = src / "small.jpg"
+            large = src / "large.jpg"
+            Image.new("RGB", (500, 500), color="yellow").save(small, format="JPEG")
+            Image.new("RGB", (5000, 4000), color="orange").save(large, format="JPEG")
+
+            with ConversionPipeline(str(out), [small, large], workers=2) as pipeline:
+                small_result = pipeline.result(small)
+                large_result = pipeline.result(large)
+
+            assert small_result.success and small_result.converted_path is None
+            assert large_result.success and large_result.converted_path is not None
+            with Image.open(large_result.converted_path) as converted:
+                assert converted.width <= 3840 and converted.height <= 2160
+
+    def test_unqueued_path_converts_inline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            jpg_path = Path(tmp_dir) / "late.jpg"
+            Image.new("RGB", (500, 500), color="cyan").save(jpg_path, format="JPEG")
+
+            with ConversionPipeline(tmp_dir, [], workers=1) as pipeline:
+                result = pipeline.result(jpg_path)
+
+            assert result.success
+            assert result.source_path == str(jpg_path)
+
+
 class TestArtDeletion:
     """Test art deletion functionality."""
 
@@ -335,6 +579,75 @@ class TestArtDeletion:
         assert result["deleted"] == 2
         assert mock_tv.art().delete.call_count == 2
 
+    def test_delete_all_fallback_retries_transient_failure(self) -> None:
+        """A single delete that times out once is retried, not counted as failed."""
+        mock_tv = Mock()
+        mock_tv.art().delete_list.side_effect = Exception("Batch failed")
+        mock_tv.art().delete.side_effect = [TimeoutError("slow TV"), None, None]
+
+        client = Mock(spec=SamsungFrameClient)
+        client.tv = mock_tv
+        client.get_available_art.return_value = [
+            {"content_id": "MY_F0001"},
+            {"content_id": "MY_F0002"},
+        ]
+
+        with patch("time.sleep"):  # skip tenacity's retry backoff
+            result = delete_all_art(client, force=True)
+
+        assert result == {"total": 2, "deleted": 2, "failed": 0}
+        assert mock_tv.art().delete.call_count == 3
+
+    def test_delete_all_fallback_stops_when_reconnect_fails(self) -> None:
+        """delete-all's fallback shares the serial helper: a dropped connection that
+        cannot be re-established stops the deletes and counts the rest as failed."""
+        mock_tv = Mock()
+        mock_tv.art().delete_list.side_effect = Exception("Batch failed")
+        mock_tv.art().delete.side_effect = ConnectionError("closed")
+
+        client = Mock(spec=SamsungFrameClient)
+        client.tv = mock_tv
+        client.get_available_art.return_value = [
+            {"content_id": "MY_F0001"},
+            {"content_id": "MY_F0002"},
+            {"content_id": "MY_F0003"},
+        ]
+        client.ping.side_effect = ConnectionError("closed")
+        client.connect_ready.return_value = False
+
+        with patch("time.sleep"):  # skip tenacity's retry backoff
+            result = delete_all_art(client, force=True)
+
+        assert result == {"total": 3, "deleted": 0, "failed": 3}
+        assert mock_tv.art().delete.call_count == 2  # MY_F0001 and its retry only
+        client.connect_ready.assert_called_once()
+
+    def test_delete_by_ids_serial_fallback(self) -> None:
+        """Batch failure falls back to single deletes issued one at a time, in order;
+        failures are counted."""
+        mock_tv = Mock()
+        mock_tv.art().delete_list.side_effect = Exception("Batch failed")
+
+        def delete(cid: str) -> None:
+            if cid == "MY_F0003":
+                raise RuntimeError("gone")
+
+        mock_tv.art().delete.side_effect = delete
+
+        client = Mock(spec=SamsungFrameClient)
+        client.tv = mock_tv
+
+        with patch("time.sleep"):  # skip tenacity's retry backoff
+            result = delete_art_by_ids(client, ["MY_F0001", "MY_F0002", "MY_F0003"])
+
+        assert result == {"total": 3, "deleted": 2, "failed": 1}
+        assert [c.args[0] for c in mock_tv.art().delete.call_args_list] == [
+            "MY_F0001",
+            "MY_F0002",
+            "MY_F0003",
+            "MY_F0003",  # retried once
+        ]
+
     def test_delete_not_connected(self) -> None:
         """Test deletion fails when not connected."""
         client = Mock(spec=SamsungFrameClient)
@@ -427,6 +740,69 @@ class TestStaleArtFromApi:
         assert "MY_F003" in stale
 
 
+class TestUploadIndex:
+    """Test content-hash dedup of images already on the TV."""
+
+    def test_content_hash_ignores_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data = os.urandom(300 * 1024)
+            a, b = Path(tmp_dir) / "a.jpg", Path(tmp_dir) / "b.jpg"
+            a.write_bytes(data)
+            b.write_bytes(data)
+            assert content_hash(a) == content_hash(b)
+
+    def test_content_hash_sees_tail_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data = bytearray(300 * 1024)
+            a, b = Path(tmp_dir) / "a.jpg", Path(tmp_dir) / "b.jpg"
+            a.write_bytes(data)
+            data[-1] = 1
+            b.write_bytes(data)
+            assert content_hash(a) != content_hash(b)
+
+    def test_index_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_file = os.path.join(tmp_dir, "nested", "uploaded.json")
+            assert load_upload_index(index_file) == {}
+            save_upload_index(index_file, {"abc": "MY_F0001"})
+            assert load_upload_index(index_file) == {"abc": "MY_F0001"}
+
+    def test_corrupt_index_is_ignored(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index_file = Path(tmp_dir) / "uploaded.json"
+            index_file.write_text("{not json")
+            assert load_upload_index(str(index_file)) == {}
+
+    def test_prune_drops_ids_gone_from_tv(self) -> None:
+        index = {"h1": "MY_F0001", "h2": "MY_F0002"}
+        art_list = [{"content_id": "MY_F0001"}, {"content_id": "SAM-S0001"}]
+        assert prune_upload_index(index, art_list) == {"h1": "MY_F0001"}
+
+    def test_prune_keeps_index_when_listing_is_empty(self) -> None:
+        """get_available_art() returns [] on errors; that must not erase history."""
+        assert prune_upload_index({"h1": "MY_F0001"}, []) is None
+
+    def test_filter_already_uploaded(self) -> None:
+        images = [Path("/p/old.jpg"), Path("/p/new.jpg"), Path("/p/unhashed.jpg")]
+        hashes = {"/p/old.jpg": "h1", "/p/new.jpg": "h2"}
+        remaining, live = filter_already_uploaded(images, hashes, {"h1": "MY_F0001"})
+        assert remaining == [Path("/p/new.jpg"), Path("/p/unhashed.jpg")]
+        assert live == {"h1": "MY_F0001"}
+
+
+class TestCalculateImagesToDelete:
+    @pytest.mark.parametrize("min_images", [1, 3, 8, 9])
+    def test_deletes_exact_distinct_subset(self, min_images: int) -> None:
+        existing = [f"MY_F{i:04d}" for i in range(10)]
+        to_delete = calculate_images_to_delete(existing, 0, min_images)
+        assert len(to_delete) == 10 - min_images
+        assert len(set(to_delete)) == len(to_delete)
+        assert set(to_delete) <= set(existing)
+
+    def test_keeps_all_under_minimum(self) -> None:
+        assert calculate_images_to_delete(["MY_F0001"], 1, 5) == []
+
+
 class TestStartIndex:
     """Test --start-index behavior via discover + slice."""
 
@@ -1,14 +1,17 @@
 """Tests for Samsung Frame TV CLI handlers."""
 
 import argparse
+import subprocess
+import sys
+from pathlib import Path
 
 from unittest.mock import Mock, patch, MagicMock
 
-from SamsungFrame.manage_samsung import reboot_tv, show_status, list_art
+from SamsungFrame.manage_samsung import _COMMANDS, main, reboot_tv, show_status, list_art
 
 
 class TestRebootTvHandler:
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_connect_fails_returns_1(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(
@@ -22,7 +25,7 @@ class TestRebootTvHandler:
 
         assert result == 1
 
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_reboot_success_returns_0(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(return_value=mock_client)
@@ -35,7 +38,7 @@ class TestRebootTvHandler:
 
         assert result == 0
 
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_reboot_failure_returns_1(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(return_value=mock_client)
@@ -50,7 +53,7 @@ class TestRebootTvHandler:
 
 
 class TestShowStatusHandler:
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_connect_fails_returns_1(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(
@@ -64,7 +67,7 @@ class TestShowStatusHandler:
 
         assert result == 1
 
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_success_returns_0(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(return_value=mock_client)
@@ -83,7 +86,7 @@ class TestShowStatusHandler:
 
 
 class TestListArtHandler:
-    @patch("SamsungFrame.manage_samsung.SamsungFrameClient")
+    @patch("SamsungFrame.samsung_client.SamsungFrameClient")
     def test_success_returns_0(self, mock_cls: Mock) -> None:
         mock_client = MagicMock()
         mock_client.__enter__ = Mock(return_value=mock_client)
@@ -95,3 +98,28 @@ class TestListArtHandler:
         result = list_art(args)
 
         assert result == 0
+
+
+class TestMainDispatch:
+    def test_routes_to_handler(self) -> None:
+        handler = Mock(return_value=7)
+        with (
+            patch("sys.argv", ["manage_samsung.py", "purge", "--days", "3"]),
+            patch.dict(_COMMANDS, {"purge": handler}),
+        ):
+            assert main() == 7
+        assert handler.call_args.args[0].days == 3
+
+    def test_no_command_returns_1(self) -> None:
+        with patch("sys.argv", ["manage_samsung.py"]):
+            assert main() == 1
+
+
+def test_import_does_not_load_client() -> None:
+    """--help and argument errors shouldn't pay for samsungtvws/Pillow imports."""
+    code = (
+        "import sys, SamsungFrame.manage_samsung; "
+        "sys.exit('SamsungFrame.samsung_client' in sys.modules)"
+    )
+    repo_root = Path(__file__).resolve().parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=repo_root).returncode == 0
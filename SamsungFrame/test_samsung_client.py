@@ -8,6 +8,7 @@ import pytest
 from PIL import Image
 from unittest.mock import Mock, patch, MagicMock
 
+from SamsungFrame.batch_upload import delete_art_by_ids
 from SamsungFrame.samsung_client import SamsungFrameClient
 
 TV_HOST = "192.0.2.4"
@@ -131,6 +132,7 @@ class TestSamsungFrameClient:
             summary = client.upload_images(paths)
             assert summary.successful_uploads == 3
             assert summary.failed_uploads == 0
+            assert list(summary.uploaded_sources) == paths
 
     @patch("SamsungFrame.samsung_client.SamsungTVWS")
     def test_upload_images_partial_failure(self, mock_tv_cls: Mock) -> None:
@@ -191,6 +193,67 @@ class TestSamsungFrameClient:
         mock_tv.art().select_image.assert_any_call("MY_F0001")
         mock_tv.art().select_image.assert_any_call("MY_F0002")
 
+    def test_download_thumbnails_counts_failures(self) -> None:
+        def get_thumbnail(content_id: str) -> bytes:
+            if content_id == "MY_F0002":
+                raise TimeoutError("no thumbnail")
+            return b"jpeg-bytes"
+
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [
+            {"content_id": "MY_F0001"},
+            {"content_id": "MY_F0002"},
+            {"content_id": "MY_F0003"},
+            {"content_id": "ART_12345"},
+        ]
+        mock_tv.art().get_thumbnail.side_effect = get_thumbnail
+        client = make_client()
+        client.tv = mock_tv
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result = client.download_thumbnails(tmp_dir, user_photos_only=True)
+
+            assert result == {"total": 3, "downloaded": 2, "failed": 1}
+            assert sorted(os.listdir(tmp_dir)) == ["MY_F0001.jpg", "MY_F0003.jpg"]
+
+    def test_download_thumbnails_stops_when_reconnect_fails(self) -> None:
+        """A failed fetch with a dead connection reconnects; if that fails, stop."""
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [
+            {"content_id": "MY_F0001"},
+            {"content_id": "MY_F0002"},
+            {"content_id": "MY_F0003"},
+        ]
+        mock_tv.art().get_thumbnail.side_effect = [b"jpeg-bytes", ConnectionError("closed")]
+        client = make_client()
+        client.tv = mock_tv
+
+        with (
+            tempfile.TemporaryDirectory() as tmp_dir,
+            patch.object(client, "ping", side_effect=ConnectionError("closed")),
+            patch.object(client, "_reconnect", return_value=False) as reconnect,
+        ):
+            result = client.download_thumbnails(tmp_dir, user_photos_only=True)
+
+            assert result == {"total": 3, "downloaded": 1, "failed": 1}
+            assert os.listdir(tmp_dir) == ["MY_F0001.jpg"]
+            reconnect.assert_called_once()
+            assert mock_tv.art().get_thumbnail.call_count == 2
+
+    @patch("time.sleep")
+    def test_cycle_images_waits_after_failed_select(self, mock_sleep: Mock) -> None:
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [{"content_id": "MY_F0001"}]
+        mock_tv.art().select_image.side_effect = ConnectionError("TV gone")
+        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+        client = make_client()
+        client.tv = mock_tv
+        client.cycle_images(period=15, shuffle=False)
+
+        assert mock_tv.art().select_image.call_count == 2
+        assert mock_sleep.call_count == 2  # each failure still waits out the period
+
 
 class TestPing:
     def test_not_connected_raises(self) -> None:
@@ -238,6 +301,53 @@ class TestGetAvailableArtStrict:
 
         assert client.get_available_art() == []
 
+    def test_reuses_readiness_probe_once(self) -> None:
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [{"content_id": "MY_F001"}]
+        client = make_client()
+        client.tv = mock_tv
+
+        with patch.object(client, "_send_wol"):
+            assert client.ensure_art_mode()
+        available = mock_tv.art().available
+        available.reset_mock()
+
+        assert client.get_available_art() == [{"content_id": "MY_F001"}]
+        assert available.call_count == 0
+        client.get_available_art()
+        assert available.call_count == 1
+
+    def test_upload_discards_readiness_probe(self) -> None:
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [{"content_id": "MY_F001"}]
+        client = make_client()
+        client.tv = mock_tv
+
+        with patch.object(client, "_send_wol"):
+            assert client.ensure_art_mode()
+        with tempfile.NamedTemporaryFile(suffix=".jpg") as tmp:
+            Image.new("RGB", (100, 100)).save(tmp.name, format="JPEG")
+            client.upload_image(tmp.name)
+        available = mock_tv.art().available
+        available.reset_mock()
+
+        client.get_available_art()
+        assert available.call_count == 1
+
+    def test_delete_discards_readiness_probe(self) -> None:
+        """get_available_art after a delete lists the TV again, not the stale probe."""
+        mock_tv = Mock()
+        mock_tv.art().available.return_value = [{"content_id": "MY_F001"}]
+        client = make_client()
+        client.tv = mock_tv
+
+        with patch.object(client, "_send_wol"):
+            assert client.ensure_art_mode()
+        delete_art_by_ids(client, ["MY_F001"])
+        mock_tv.art().available.return_value = []
+
+        assert client.get_available_art() == []
+
 
 class TestReconnectDuringUpload:
     @patch("time.sleep")
@@ -232,6 +232,9 @@ class SamsungFrameConfig:
     min_size_mb: float
     min_images: int
     slideshow_delay_seconds: int
+    conversion_cache_dir: str
+    conversion_cache_max_mb: int
+    upload_index_file: str
 
 
 @dataclass